@@ -20,6 +20,7 @@ import time
 
 import pandas
 import polars
+import pyarrow
 
 from locopy.errors import CredentialsError, DBError
 from locopy.logger import INFO, get_logger
@@ -149,6 +150,40 @@ class Database:
         DBError
             if a problem occurs executing the ``sql`` statement
 
+        DBError
+            If a connection to the database cannot be made
+        """
+
+        def run(cursor):
+            if many:
+                cursor.executemany(sql, params)
+            else:
+                cursor.execute(sql, params)
+
+        self._run_sql(sql, run, commit=commit, verbose=verbose)
+
+    def _run_sql(self, sql, run, commit=True, verbose=True):
+        """Run ``run(cursor)`` with the checks, logging and commit of ``execute``.
+
+        Parameters
+        ----------
+        sql : str
+            SQL which ``run`` executes, used for logging.
+
+        run : callable
+            Called with the cursor to execute ``sql``.
+
+        commit : Boolean, default True
+            Whether to "commit" the commands to the cluster immediately or not.
+
+        verbose: bool, default True
+            Whether to print executed query
+
+        Raises
+        ------
+        DBError
+            if a problem occurs executing the ``sql`` statement
+
         DBError
             If a connection to the database cannot be made
         """
@@ -157,10 +192,7 @@ class Database:
             if verbose:
                 logger.info("Running SQL: %s", sql)
             try:
-                if many:
-                    self.cursor.executemany(sql, params)
-                else:
-                    self.cursor.execute(sql, params)
+                run(self.cursor)
             except Exception as e:
                 logger.error("Error running SQL query. err: %s", e)
                 raise DBError("Error running SQL query.") from e
@@ -191,7 +223,7 @@ class Database:
         except Exception:
             return [column[0].lower() for column in self.cursor.description]
 
-    def to_dataframe(self, df_type="pandas", size=None):
+    def to_dataframe(self, df_type="pandas", size=None, dtype_backend=None):
         """Return a dataframe of the last query results.
 
         Parameters
@@ -202,6 +234,14 @@ class Database:
         size : int, optional
             Chunk size to fetch.  Defaults to None.
 
+        dtype_backend : Literal["pyarrow"], optional
+            Only used for pandas output. If ``"pyarrow"`` the dataframe is built from
+            an Arrow table and uses ``pandas.ArrowDtype`` columns, which is faster and
+            lighter for string heavy results. Results Arrow cannot hold as is (rows
+            of different lengths, or a column mixing Python types) are built as
+            usual and converted with ``convert_dtypes``, so such a column stays
+            ``object``. Defaults to None (numpy dtypes).
+
         Returns
         -------
         pandas.DataFrame or polars.DataFrame
@@ -210,6 +250,8 @@ class Database:
         """
         if df_type not in ["pandas", "polars"]:
             raise ValueError("df_type must be ``pandas`` or ``polars``.")
+        if dtype_backend not in [None, "pyarrow"]:
+            raise ValueError("dtype_backend must be ``None`` or ``pyarrow``.")
         columns = self.column_names()
 
         if size is None:
@@ -224,8 +266,28 @@ class Database:
         if len(fetched) == 0:
             return None
 
-        if df_type == "pandas":
-            return pandas.DataFrame(fetched, columns=columns or None)
+        if df_type == "pandas" and dtype_backend == "pyarrow":
+            width = len(fetched[0])
+            if all(len(row) == width for row in fetched):
+                names = columns or [str(i) for i in range(width)]
+                try:
+                    table = pyarrow.Table.from_arrays(
+                        [pyarrow.array(column) for column in zip(*fetched)],
+                        names=names,
+                    )
+                    df = table.to_pandas(types_mapper=pandas.ArrowDtype)
+                    if not columns:
+                        # integer labels, as from_records gives below
+                        df.columns = range(width)
+                    return df
+                except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                    # e.g. a column mixing Python types, which has no Arrow type
+                    pass
+            return pandas.DataFrame.from_records(
+                fetched, columns=columns or None
+            ).convert_dtypes(dtype_backend="pyarrow")
+        elif df_type == "pandas":
+            return pandas.DataFrame.from_records(fetched, columns=columns or None)
         elif df_type == "polars":
             return polars.DataFrame(fetched, schema=columns, orient="row")
 
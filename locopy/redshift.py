@@ -21,6 +21,7 @@ to Redshift, and run arbitrary code.
 """
 
 import os
+import re
 from functools import singledispatch
 from pathlib import Path
 
@@ -43,6 +44,19 @@ from locopy.utility import (
 
 logger = get_logger(__name__, INFO)
 
+# a statement, at the start of the SQL or after a ``;`` and any leading
+# ``--`` or ``/* */`` comments, which may change a table's columns
+TABLE_CHANGING_SQL = re.compile(
+    r"(?:^|;)(?:\s|--[^\n]*|/\*.*?\*/)*(?:ALTER|CREATE|DROP|TRUNCATE)\b",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# one part of a table name: a double quoted identifier (``""`` escapes a quote)
+# or an unquoted one
+IDENTIFIER = r'"(?:[^"]|"")+"|[^."]+'
+TABLE_NAME = re.compile(rf"(?:{IDENTIFIER})(?:\.(?:{IDENTIFIER}))*")
+IDENTIFIER_PART = re.compile(IDENTIFIER)
+
 
 def add_default_copy_options(copy_options=None):
     """Add in default options for the ``COPY`` job.
@@ -173,6 +187,7 @@ class Redshift(S3, Database):
                 "S3 credentials were not found. S3 functionality is disabled"
             )
         Database.__init__(self, dbapi, config_yaml, **kwargs)
+        self._column_names = {}
 
     def connect(self):
         """Create a connection to the Redshift cluster.
@@ -188,8 +203,63 @@ class Redshift(S3, Database):
             self.connection["sslmode"] = "require"
         elif self.dbapi.__name__ == "pg8000":
             self.connection["ssl_context"] = True
+        self._column_names.clear()
         super().connect()
 
+    def disconnect(self):
+        """Terminate the connection.
+
+        Closes the values of the ``conn`` and ``cursor`` attributes, and drops
+        the column names cached for this connection.
+
+        Raises
+        ------
+        DBError
+            If there is a problem disconnecting from Redshift.
+        """
+        self._column_names.clear()
+        super().disconnect()
+
+    def execute(self, sql, commit=True, params=(), many=False, verbose=True):
+        """Execute some sql against the connection.
+
+        An ``ALTER``, ``CREATE``, ``DROP`` or ``TRUNCATE`` statement anywhere in
+        ``sql`` may change a table's columns, so it also drops the column names
+        cached by ``_get_column_names``. So does ``sql`` which is not a ``str``
+        (e.g. a psycopg2 ``sql.Composed``), as it cannot be checked. DDL run
+        outside of ``execute`` is not seen, see ``unload_and_copy``.
+
+        Parameters
+        ----------
+        sql : str
+            SQL to run against the connection.  Could be one or multiple
+            statements.
+
+        commit : Boolean, default True
+            Whether to "commit" the commands to the cluster immediately or not.
+
+        params : iterable of parameters
+            Parameters to submit with the query. The exact syntax will depend
+            on the database adapter you are using
+
+        many : bool, default False
+            Whether to execute the script as an "execute many"
+
+        verbose: bool, default True
+            Whether to print executed query
+
+        Raises
+        ------
+        DBError
+            if a problem occurs executing the ``sql`` statement
+
+        DBError
+            If a connection to the database cannot be made
+        """
+        if not isinstance(sql, str) or TABLE_CHANGING_SQL.search(sql):
+            self._column_names.clear()
+        super().execute(sql, commit=commit, params=params, many=many, verbose=verbose)
+
     def copy(self, table_name, s3path, delim="|", copy_options=None):
         """Execute the COPY command to load files from S3 into a Redshift table.
 
@@ -357,6 +427,7 @@ class Redshift(S3, Database):
         delete_s3_after=True,
         parallel_off=False,
         unload_options=None,
+        cache_column_names=False,
     ):
         """Unload data from Redshift.
 
@@ -398,6 +469,12 @@ class Redshift(S3, Database):
             A list of unload options that should be appended to the UNLOAD
             statement.
 
+        cache_column_names : bool, optional
+            Reuse the column names of ``query`` from an earlier call on this
+            connection, rather than asking Redshift again. Defaults to False.
+            Only set it when the tables behind ``query`` are not altered other
+            than through :meth:`execute`, or the header may be out of date.
+
         Raises
         ------
         Exception
@@ -425,7 +502,7 @@ class Redshift(S3, Database):
             logger.error("No files generated from unload")
             raise DBError("No files generated from unload")
 
-        columns = self._get_column_names(query)
+        columns = self._get_column_names(query, cache=cache_column_names)
         if columns is None:
             logger.error("Unable to retrieve column names from exported data")
             raise DBError("Unable to retrieve column names from exported data.")
@@ -481,7 +558,7 @@ class Redshift(S3, Database):
             logger.error("Error running UNLOAD on redshift. err: %s", e)
             raise DBError("Error running UNLOAD on redshift.") from e
 
-    def _get_column_names(self, query):
+    def _get_column_names(self, query, cache=False):
         """Get a list of column names from the supplied query.
 
         Parameters
@@ -489,23 +566,33 @@ class Redshift(S3, Database):
         query : str
             A query (or table name) to be unloaded to S3.
 
+        cache : bool, default False
+            Reuse, and keep, the column names for ``query`` until the next
+            ``connect``, ``disconnect`` or statement which may change a table
+            (see :meth:`execute`).
+
         Returns
         -------
         list
             List of column names. Returns None if no columns were retrieved.
         """
+        if cache and query in self._column_names:
+            return self._column_names[query]
         try:
             logger.info("Retrieving column names")
             sql = f"SELECT * FROM ({query}) WHERE 1 = 0"
             self.execute(sql)
             results = list(self.cursor.description)
             if len(results) > 0:
-                return [result[0].strip() for result in results]
+                columns = [result[0].strip() for result in results]
             else:
-                return None
+                columns = None
         except Exception:
             logger.error("Error retrieving column names")
             raise
+        if cache:
+            self._column_names[query] = columns
+        return columns
 
     def _unload_generated_files(self):
         """Get a list of files generated by the unload process.
@@ -540,12 +627,19 @@ class Redshift(S3, Database):
         metadata=None,
         batch_size=1000,
         verbose=False,
+        if_exists="fail",
     ):
         """
         Insert a Pandas or Polars dataframe to an existing table or a new table.
 
         `executemany` in psycopg2 and pg8000 has very poor performance in terms of running speed.
         To overcome this issue, we instead format the insert query and then run `execute`.
+        When the connection uses psycopg2, each batch is sent with
+        `psycopg2.extras.execute_values`, which quotes the values in C.
+
+        Redshift does not support ``COPY ... FROM STDIN``, so for large
+        dataframes write them to a file and use :meth:`load_and_copy`, which
+        stages the data on S3 and loads it with ``COPY``.
 
         Parameters
         ----------
@@ -570,8 +664,24 @@ class Redshift(S3, Database):
         verbose: bool, default False
             Whether or not to print out insert query
 
+        if_exists: str, default "fail"
+            What to do when ``create`` is set and the table already exists.
+            ``fail`` issues the ``CREATE TABLE`` regardless, ``append`` skips it
+            and inserts into the existing table, and ``replace`` drops the table
+            and creates it again in one transaction. Anything other than ``fail``
+            checks ``information_schema.tables`` first.
 
+        Raises
+        ------
+        ValueError
+            If ``if_exists`` is not one of ``fail``, ``append`` or ``replace``,
+            or ``table_name`` cannot be parsed to check whether it exists.
         """
+        if if_exists not in ("fail", "append", "replace"):
+            raise ValueError(
+                "if_exists must be one of ``fail``, ``append`` or ``replace``."
+            )
+
         if columns:
             dataframe = dataframe[columns]
 
@@ -598,71 +708,194 @@ class Redshift(S3, Database):
                 + ")"
             )
             column_sql = "(" + ",".join(list(metadata.keys())) + ")"
-            create_query = f"CREATE TABLE {table_name} {create_join}"
-            self.execute(create_query)
-            logger.info("New table has been created")
-
-        # create a list of tuples for insert
+            exists = if_exists != "fail" and self._table_exists(table_name)
+            if exists and if_exists == "append":
+                logger.info("Table already exists. Skipping table creation ...")
+            else:
+                if exists:
+                    # committed together with the CREATE, so a failed CREATE
+                    # does not lose the existing table
+                    self.execute(f"DROP TABLE {table_name}", commit=False)
+                create_query = f"CREATE TABLE {table_name} {create_join}"
+                self.execute(create_query)
+                logger.info("New table has been created")
+
+        # build the insert values a column at a time, so the per-cell work
+        # runs in pandas/polars rather than in a Python loop over rows
         @singledispatch
-        def get_insert_tuple(dataframe, start, batch_size):
-            """Create a list of tuples for insert."""
-            pass
-
-        @get_insert_tuple.register(pd.DataFrame)
-        def get_insert_tuple_pandas(dataframe: pd.DataFrame, start, batch_size):
-            """Create a list of tuples for insert when dataframe is pd.DataFrame."""
-            to_insert = []
-            for row in dataframe[start : (start + batch_size)].itertuples(index=False):
-                none_row = (
-                    "("
-                    + ", ".join(
+        def get_insert_values(dataframe, start, batch_size, quote=False):
+            """Create a list of tuples, or of ``VALUES`` rows if ``quote``, for insert."""
+            raise TypeError
+
+        @get_insert_values.register(pd.DataFrame)
+        def get_insert_values_pandas(
+            dataframe: pd.DataFrame, start, batch_size, quote=False
+        ):
+            """Create the insert values when dataframe is pd.DataFrame."""
+            batch = dataframe[start : (start + batch_size)]
+            values = []
+            for _, column in batch.items():
+                if column.dtype.kind in "mM":
+                    # astype(str) drops the time of midnight timestamps
+                    text = column.astype(object).map(str)
+                elif (
+                    column.dtype.kind == "O"
+                    and pd.api.types.infer_dtype(column, skipna=True) != "string"
+                ):
+                    # e.g. bytes, which astype(str) decodes but str() does not
+                    text = column.map(str)
+                else:
+                    text = column.astype(str)
+                if quote:
+                    text = "'" + text.str.replace("'", "''", regex=False) + "'"
+                values.append(text.where(column.notna(), "NULL" if quote else None))
+            if not quote:
+                return list(zip(*(text.tolist() for text in values)))
+            rows = values[0]
+            for text in values[1:]:
+                rows = rows + ", " + text
+            return ("(" + rows + ")").tolist()
+
+        @get_insert_values.register(pl.DataFrame)
+        def get_insert_values_polars(
+            dataframe: pl.DataFrame, start, batch_size, quote=False
+        ):
+            """Create the insert values when dataframe is pl.DataFrame."""
+            batch = dataframe[start : (start + batch_size)]
+            batch = batch.with_columns(batch.select(cs.numeric().fill_nan(None)))
+            values = []
+            for name, dtype in batch.schema.items():
+                column = pl.col(name)
+                if (
+                    dtype.is_integer()
+                    or dtype.is_float()
+                    or dtype in (pl.String, pl.Categorical, pl.Date)
+                ):
+                    text = column.cast(pl.String)
+                elif dtype == pl.Boolean:
+                    text = pl.when(column).then(pl.lit("True")).when(~column)
+                    text = text.then(pl.lit("False"))
+                elif isinstance(dtype, pl.Datetime):
+                    # %.f leaves out a zero fraction, as str() does
+                    fmt = "%Y-%m-%d %H:%M:%S%.f" + ("%:z" if dtype.time_zone else "")
+                    text = column.dt.to_string(fmt)
+                else:
+                    # e.g. lists, structs and decimals: str() of the Python values
+                    strings = [
+                        None if val is None else str(val)
+                        for val in batch.get_column(name).to_list()
+                    ]
+                    batch = batch.with_columns(pl.Series(name, strings, pl.String))
+                    text = column
+                if quote:
+                    text = pl.concat_str(
                         [
-                            "NULL"
-                            if pd.isnull(val)
-                            else "'" + str(val).replace("'", "''") + "'"
-                            for val in row
+                            pl.lit("'"),
+                            text.str.replace_all("'", "''", literal=True),
+                            pl.lit("'"),
                         ]
-                    )
-                    + ")"
-                )
-                to_insert.append(none_row)
-            return to_insert
-
-        @get_insert_tuple.register(pl.DataFrame)
-        def get_insert_tuple_polars(dataframe: pl.DataFrame, start, batch_size):
-            """Create a list of tuples for insert when dataframe is pl.DataFrame."""
-            to_insert = []
-            dataframe = dataframe.with_columns(
-                dataframe.select(cs.numeric().fill_nan(None))
+                    ).fill_null("NULL")
+                values.append(text.alias(name))
+            if not quote:
+                return batch.select(values).rows()
+            rows = pl.concat_str(
+                [pl.lit("("), pl.concat_str(values, separator=", "), pl.lit(")")]
             )
-            for row in dataframe[start : (start + batch_size)].iter_rows():
-                none_row = (
-                    "("
-                    + ", ".join(
-                        [
-                            "NULL"
-                            if val is None
-                            else "'" + str(val).replace("'", "''") + "'"
-                            for val in row
-                        ]
-                    )
-                    + ")"
-                )
-                to_insert.append(none_row)
-            return to_insert
+            return batch.select(rows).to_series().to_list()
 
         logger.info("Inserting records...")
+        insert_prefix = f"INSERT INTO {table_name} {column_sql} VALUES "
+        execute_values = self.dbapi.__name__ == "psycopg2"
         try:
             for start in range(0, len(dataframe), batch_size):
-                to_insert = get_insert_tuple(dataframe, start, batch_size)
-                string_join = ", ".join(to_insert)
-                insert_query = (
-                    f"""INSERT INTO {table_name} {column_sql} VALUES {string_join}"""
+                if execute_values:
+                    self._execute_values(
+                        insert_prefix + "%s",
+                        get_insert_values(dataframe, start, batch_size),
+                        page_size=batch_size,
+                        verbose=verbose,
+                    )
+                    continue
+                string_join = ", ".join(
+                    get_insert_values(dataframe, start, batch_size, quote=True)
                 )
-                self.execute(insert_query, verbose=verbose)
+                self.execute(insert_prefix + string_join, verbose=verbose)
         except TypeError:
             raise TypeError(
                 "DataFrame to insert must either be a pandas.DataFrame or polars.DataFrame."
             ) from None
 
         logger.info("Table insertion has completed")
+
+    def _table_exists(self, table_name):
+        """Check whether a table exists.
+
+        Parameters
+        ----------
+        table_name : str
+            The table name, optionally qualified as ``schema.table`` or
+            ``database.schema.table``. An unqualified name is only looked up in
+            the schemas on the search path (including the temporary schema),
+            where ``CREATE``, ``DROP`` and ``INSERT`` would resolve it. Unquoted
+            parts are lower cased, double quoted parts keep their case.
+
+        Returns
+        -------
+        bool
+            True if ``information_schema.tables`` has a matching table.
+
+        Raises
+        ------
+        ValueError
+            If ``table_name`` is not a valid, optionally quoted, table name.
+        """
+        if not TABLE_NAME.fullmatch(table_name):
+            raise ValueError(f"Invalid table name: {table_name}")
+        *schema, table = [
+            part[1:-1].replace('""', '"') if part.startswith('"') else part.lower()
+            for part in IDENTIFIER_PART.findall(table_name)
+        ]
+        sql = "SELECT 1 FROM information_schema.tables WHERE table_name = %s"
+        params = (table,)
+        if schema:
+            sql += " AND table_schema = %s"
+            params += (schema[-1],)
+        else:
+            sql += " AND table_schema = ANY(current_schemas(true))"
+        self.execute(sql, params=params)
+        return self.cursor.fetchone() is not None
+
+    def _execute_values(self, sql, values, page_size=1000, verbose=False):
+        """Run a multi-row ``INSERT`` through ``psycopg2.extras.execute_values``.
+
+        The values are quoted by psycopg2 in C and sent ``page_size`` rows per
+        statement, rather than building the ``VALUES`` list in Python.
+
+        Parameters
+        ----------
+        sql : str
+            ``INSERT`` statement with a single ``VALUES %s`` placeholder.
+
+        values : list
+            List of tuples to insert.
+
+        page_size : int, default 1000
+            Maximum number of rows per statement.
+
+        verbose : bool, default False
+            Whether to print executed query
+
+        Raises
+        ------
+        DBError
+            if a problem occurs executing the ``sql`` statement
+
+        DBError
+            If a connection to the database cannot be made
+        """
+        from psycopg2.extras import execute_values
+
+        def run(cursor):
+            execute_values(cursor, sql, values, page_size=page_size)
+
+        self._run_sql(sql, run, verbose=verbose)
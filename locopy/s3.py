@@ -21,6 +21,7 @@ multipart upload to S3 buckets.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from boto3 import Session
 from boto3.s3.transfer import TransferConfig
@@ -108,7 +109,10 @@ class S3:
 
     def _set_client(self):
         try:
-            self.s3 = self.session.client("s3", config=Config(signature_version="s3v4"))
+            # enough connections for the 16 workers of ``download_list_from_s3``,
+            # each using up to 5 threads in ``download_from_s3``
+            config = Config(signature_version="s3v4", max_pool_connections=80)
+            self.s3 = self.session.client("s3", config=config)
             logger.info("Successfully initialized S3 client.")
         except Exception as e:
             logger.error("Error initializing S3 Client, err: %s", e)
@@ -211,12 +215,14 @@ class S3:
             logger.info(
                 "Uploading file to S3 bucket: %s", self._generate_s3_path(bucket, key)
             )
+            config = TransferConfig(max_concurrency=16)
             self.s3.upload_file(
                 local,
                 bucket,
                 key,
                 ExtraArgs=extra_args,
                 Callback=ProgressPercentage(local),
+                Config=config,
             )
         except Exception as e:
             logger.error("Error uploading to S3. err: %s", e)
@@ -294,7 +300,7 @@ class S3:
             logger.error("Error downloading from S3. err: %s", e)
             raise S3DownloadError("Error downloading from S3.") from e
 
-    def download_list_from_s3(self, s3_list, local_path=None):
+    def download_list_from_s3(self, s3_list, local_path=None, max_workers=16):
         """
         Download a list of files from s3.
 
@@ -307,6 +313,14 @@ class S3:
             The local path where the files will be copied to. Defualts to the current working
             directory (``os.getcwd()``)
 
+        max_workers : int, default 16
+            The maximum number of files downloaded at the same time. Each
+            download uses up to 5 threads, and the client keeps 80 connections,
+            so larger values will wait on the connection pool. If two files
+            share a name, they are downloaded one at a time, in order, so the
+            later file overwrites the earlier one rather than both writing to it
+            at once.
+
         Returns
         -------
         list
@@ -315,13 +329,20 @@ class S3:
         if local_path is None:
             local_path = os.getcwd()
 
-        output = []
+        downloads = []
         for f in s3_list:
             s3_bucket, key = self.parse_s3_url(f)
             local = os.path.join(local_path, os.path.basename(key))
-            self.download_from_s3(s3_bucket, key, local)
-            output.append(local)
-        return output
+            downloads.append((s3_bucket, key, local))
+        if len({local for _, _, local in downloads}) < len(downloads):
+            max_workers = 1
+
+        def download(args):
+            self.download_from_s3(*args)
+            return args[2]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(download, downloads))
 
     def delete_from_s3(self, bucket, key):
         """
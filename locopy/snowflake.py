@@ -399,15 +399,22 @@ class Snowflake(S3, Database):
             raise DBError("Error running UNLOAD on Snowflake.") from e
 
     def insert_dataframe_to_table(
-        self, dataframe, table_name, columns=None, create=False, metadata=None
+        self,
+        dataframe,
+        table_name,
+        columns=None,
+        create=False,
+        metadata=None,
+        use_write_pandas=False,
     ):
         """Insert a Pandas or Polars dataframe to an existing table or a new table.
 
         In newer versions of the
         python snowflake connector (v2.1.2+) users can call the ``write_pandas`` method from the cursor
-        directly, ``insert_dataframe_to_table`` is a custom implementation and does not use
+        directly, by default ``insert_dataframe_to_table`` is a custom implementation and does not use
         ``write_pandas``. Instead of using ``COPY INTO`` the method builds a list of tuples to
-        insert directly into the table. There are also options to create the table if it doesn't
+        insert directly into the table. Set ``use_write_pandas=True`` to load through
+        ``write_pandas`` instead. There are also options to create the table if it doesn't
         exist and use your own metadata. If your data is significantly large then using
         ``COPY INTO <table>`` is more appropriate.
 
@@ -427,6 +434,12 @@ class Snowflake(S3, Database):
 
         metadata: dictionary, optional
             If metadata==None, it will be generated based on data
+
+        use_write_pandas: bool, optional
+            If ``True`` the data is loaded with the connector's ``write_pandas``, which stages
+            the dataframe as Parquet and runs ``COPY INTO`` rather than binding each row. Polars
+            dataframes are converted to pandas first. Requires the ``pandas`` extra of
+            ``snowflake-connector-python``. Defaults to ``False``.
         """
         if columns:
             dataframe = dataframe[columns]
@@ -463,12 +476,18 @@ class Snowflake(S3, Database):
             return to_insert
 
         # create a list of tuples for insert
-        try:
-            to_insert = get_insert_tuple(dataframe)
-        except TypeError:
-            raise TypeError(
-                "DataFrame to insert must either be a pandas.DataFrame or polars.DataFrame."
-            ) from None
+        if use_write_pandas:
+            if not isinstance(dataframe, (pd.DataFrame, pl.DataFrame)):
+                raise TypeError(
+                    "DataFrame to insert must either be a pandas.DataFrame or polars.DataFrame."
+                )
+        else:
+            try:
+                to_insert = get_insert_tuple(dataframe)
+            except TypeError:
+                raise TypeError(
+                    "DataFrame to insert must either be a pandas.DataFrame or polars.DataFrame."
+                ) from None
 
         if not create and metadata:
             logger.warning("Metadata will not be used because create is set to False.")
@@ -489,18 +508,68 @@ class Snowflake(S3, Database):
                 )
                 + ")"
             )
-            column_sql = "(" + ",".join(list(metadata.keys())) + ")"
+            all_columns = list(metadata.keys())
+            column_sql = "(" + ",".join(all_columns) + ")"
             create_query = f"CREATE TABLE {table_name} {create_join}"
             self.execute(create_query)
             logger.info("New table has been created")
 
-        insert_query = f"""INSERT INTO {table_name} {column_sql} VALUES {string_join}"""
-
         logger.info("Inserting records...")
-        self.execute(insert_query, params=to_insert, many=True)
+        if use_write_pandas:
+            self._write_pandas(dataframe, table_name, all_columns)
+        else:
+            insert_query = (
+                f"""INSERT INTO {table_name} {column_sql} VALUES {string_join}"""
+            )
+            self.execute(insert_query, params=to_insert, many=True)
         logger.info("Table insertion has completed")
 
-    def to_dataframe(self, df_type="pandas", size=None):
+    def _write_pandas(self, dataframe, table_name, columns):
+        """Load a dataframe into an existing table via ``write_pandas``.
+
+        Parameters
+        ----------
+        dataframe: Pandas or Polars Dataframe
+            The dataframe which needs to be inserted.
+
+        table_name: str
+            The name of the Snowflake table which is being inserted. Can be qualified as
+            ``<schema>.<table_name>`` or ``<database>.<schema>.<table_name>``.
+
+        columns: list
+            The table column names, matched to the dataframe columns by position.
+
+        Raises
+        ------
+        DBError
+            If there is a problem loading the dataframe, or a connection
+            has not been initalized.
+        """
+        if not self._is_connected():
+            raise DBError("No Snowflake connection object is present.")
+
+        from snowflake.connector.pandas_tools import write_pandas
+
+        if isinstance(dataframe, pl.DataFrame):
+            dataframe = dataframe.to_pandas()
+        dataframe = dataframe.set_axis(columns, axis="columns")
+        *namespace, table = table_name.split(".")
+        database, schema = [None, None, *namespace][-2:]
+
+        try:
+            write_pandas(
+                self.conn,
+                dataframe,
+                table,
+                database=database,
+                schema=schema,
+                quote_identifiers=False,
+            )
+        except Exception as e:
+            logger.error("Error running write_pandas on Snowflake. err: %s", e)
+            raise DBError("Error running write_pandas on Snowflake.") from e
+
+    def to_dataframe(self, df_type="pandas", size=None, dtype_backend=None):
         """Return a dataframe of the last query results.
 
         This is just a convenience method. This
@@ -517,6 +586,10 @@ class Snowflake(S3, Database):
         size : int, optional
             Chunk size to fetch.  Defaults to None.
 
+        dtype_backend : Literal["pyarrow"], optional
+            Only used for pandas output. If ``"pyarrow"`` the Arrow result is converted
+            with ``pandas.ArrowDtype`` columns instead of numpy dtypes. Defaults to None.
+
         Returns
         -------
         pandas.DataFrame or polars.DataFrame
@@ -525,11 +598,21 @@ class Snowflake(S3, Database):
         """
         if df_type not in ["pandas", "polars"]:
             raise ValueError("df_type must be ``pandas`` or ``polars``.")
+        if dtype_backend not in [None, "pyarrow"]:
+            raise ValueError("dtype_backend must be ``None`` or ``pyarrow``.")
 
         if size is None and self.cursor._query_result_format == "arrow":
-            if df_type == "pandas":
+            if df_type == "pandas" and dtype_backend == "pyarrow":
+                # fetch_arrow_all returns None rather than an empty table
+                table = self.cursor.fetch_arrow_all()
+                if table is None:
+                    return None
+                return table.to_pandas(types_mapper=pd.ArrowDtype)
+            elif df_type == "pandas":
                 return self.cursor.fetch_pandas_all()
             elif df_type == "polars":
                 return pl.from_arrow(self.cursor.fetch_arrow_all())
         else:
-            return super().to_dataframe(df_type=df_type, size=size)
+            return super().to_dataframe(
+                df_type=df_type, size=size, dtype_backend=dtype_backend
+            )
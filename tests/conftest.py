@@ -20,11 +20,27 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from unittest import mock
+
 import pytest
 from botocore.credentials import Credentials
 
+# PEP 249 cursor interface used by ``Database`` and its subclasses
+CURSOR_SPEC = [
+    "description",
+    "rowcount",
+    "arraysize",
+    "close",
+    "execute",
+    "executemany",
+    "fetchone",
+    "fetchmany",
+    "fetchall",
+    "__iter__",
+]
 
-@pytest.fixture()
+
+@pytest.fixture(scope="session")
 def credentials():
     return {
         "host": "host",
@@ -50,3 +66,19 @@ def sf_credentials():
 @pytest.fixture()
 def aws_creds():
     return Credentials("access", "secret", "token")
+
+
+@pytest.fixture()
+def patch_connect(monkeypatch):
+    def patch(dbapi):
+        connect = mock.MagicMock()
+        connect.return_value.cursor.return_value = mock.MagicMock(spec_set=CURSOR_SPEC)
+        monkeypatch.setattr(dbapi, "connect", connect)
+        return connect
+
+    return patch
+
+
+@pytest.fixture()
+def mock_connect(dbapi, patch_connect):
+    return patch_connect(dbapi)
@@ -20,16 +20,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-import sqlite3
 from unittest import mock
 
 import pandas as pd
-import pg8000
 import polars as pl
 import polars.testing as pltest
-import psycopg2
 import pytest
-import snowflake.connector
 from locopy import Database
 from locopy.errors import CredentialsError, DBError
 
@@ -43,10 +39,22 @@ other: stuff
 extra: 123
 another: 321"""
 
-DBAPIS = [sqlite3, pg8000, psycopg2, snowflake.connector]
+DBAPIS = ["sqlite3", "pg8000", "psycopg2", "snowflake.connector"]
+
+pytestmark = pytest.mark.usefixtures("mock_connect")
+
+
+@pytest.fixture(params=DBAPIS)
+def dbapi(request):
+    return pytest.importorskip(request.param)
+
+
+@pytest.fixture
+def database(credentials, dbapi):
+    with Database(dbapi=dbapi, **credentials) as test:
+        yield test
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 def test_database_constructor(credentials, dbapi):
     d = Database(dbapi=dbapi, **credentials)
     assert d.connection["host"] == "host"
@@ -56,7 +64,6 @@ def test_database_constructor(credentials, dbapi):
     assert d.connection["password"] == "password"
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 def test_database_constructor_kwargs(dbapi):
     d = Database(
         dbapi=dbapi,
@@ -73,8 +80,6 @@ def test_database_constructor_kwargs(dbapi):
     assert d.connection["password"] == "password"
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
-@mock.patch("locopy.utility.open", mock.mock_open(read_data=GOOD_CONFIG_YAML))
 def test_database_constructor_kwargs_and_yaml(dbapi):
     with pytest.raises(CredentialsError):
         Database(
@@ -88,10 +93,8 @@ def test_database_constructor_kwargs_and_yaml(dbapi):
         )
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 def test_database_constructor_with_extras(credentials, dbapi):
-    credentials["extra"] = 123
-    credentials["another"] = 321
+    credentials = dict(credentials, extra=123, another=321)
     d = Database(dbapi=dbapi, **credentials)
     assert d.connection["host"] == "host"
     assert d.connection["port"] == "port"
@@ -102,9 +105,9 @@ def test_database_constructor_with_extras(credentials, dbapi):
     assert d.connection["another"] == 321
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
+# parses real YAML, so config_yaml is covered end to end through __init__ and connect
 @mock.patch("locopy.utility.open", mock.mock_open(read_data=GOOD_CONFIG_YAML))
-def test_database_constructor_yaml(dbapi):
+def test_database_constructor_yaml(mock_connect, dbapi):
     d = Database(dbapi=dbapi, config_yaml="some_config.yml")
     assert d.connection["host"] == "host"
     assert d.connection["port"] == 1234
@@ -114,18 +117,26 @@ def test_database_constructor_yaml(dbapi):
     assert d.connection["other"] == "stuff"
     assert d.connection["extra"] == 123
     assert d.connection["another"] == 321
+    d.connect()
+    mock_connect.assert_called_with(
+        host="host",
+        port=1234,
+        database="database",
+        user="id",
+        password="pass",
+        other="stuff",
+        extra=123,
+        another=321,
+    )
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 def test_is_connected(credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        b = Database(dbapi=dbapi, **credentials)
-        assert b._is_connected() is False
+    b = Database(dbapi=dbapi, **credentials)
+    assert b._is_connected() is False
 
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        b = Database(dbapi=dbapi, **credentials)
-        b.connect()
-        assert b._is_connected() is True
+    b = Database(dbapi=dbapi, **credentials)
+    b.connect()
+    assert b._is_connected() is True
 
     # throws exception in _is_connected
     b = Database(dbapi=dbapi, **credentials)
@@ -133,33 +144,29 @@ def test_is_connected(credentials, dbapi):
     assert b._is_connected() is False
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
-def test_connect(credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        b = Database(dbapi=dbapi, **credentials)
-        b.connect()
-        mock_connect.assert_called_with(
-            host="host",
-            user="user",
-            port="port",
-            password="password",
-            database="database",
-        )
+def test_connect(mock_connect, credentials, dbapi):
+    b = Database(dbapi=dbapi, **credentials)
+    b.connect()
+    mock_connect.assert_called_with(
+        host="host",
+        user="user",
+        port="port",
+        password="password",
+        database="database",
+    )
 
-    credentials["extra"] = 123
-    credentials["another"] = 321
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        b = Database(dbapi=dbapi, **credentials)
-        b.connect()
-        mock_connect.assert_called_with(
-            host="host",
-            user="user",
-            port="port",
-            password="password",
-            database="database",
-            extra=123,
-            another=321,
-        )
+    credentials = dict(credentials, extra=123, another=321)
+    b = Database(dbapi=dbapi, **credentials)
+    b.connect()
+    mock_connect.assert_called_with(
+        host="host",
+        user="user",
+        port="port",
+        password="password",
+        database="database",
+        extra=123,
+        another=321,
+    )
 
     # side effect exception
     mock_connect.side_effect = Exception("Connect Exception")
@@ -167,170 +174,197 @@ def test_connect(credentials, dbapi):
         b.connect()
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 def test_disconnect(credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        b = Database(dbapi=dbapi, **credentials)
-        b.connect()
-        b.disconnect()
-        b.conn.close.assert_called_with()
-        b.cursor.close.assert_called_with()
+    b = Database(dbapi=dbapi, **credentials)
+    b.connect()
+    b.disconnect()
+    b.conn.close.assert_called_with()
+    b.cursor.close.assert_called_with()
 
     # side effect exception
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        b.connect()
-        b.conn.close.side_effect = Exception("Disconnect Exception")
-        with pytest.raises(DBError):
-            b.disconnect()
+    b.connect()
+    b.conn.close.side_effect = Exception("Disconnect Exception")
+    with pytest.raises(DBError):
+        b.disconnect()
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 def test_disconnect_no_conn(credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        b = Database(dbapi=dbapi, **credentials)
-        b.disconnect()
+    b = Database(dbapi=dbapi, **credentials)
+    b.disconnect()
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
-def test_execute(credentials, dbapi):
-    with (
-        mock.patch(dbapi.__name__ + ".connect") as mock_connect,
-        Database(dbapi=dbapi, **credentials) as test,
-    ):
-        test.execute("SELECT * FROM some_table")
-        assert test.cursor.execute.called is True
+def test_execute(database):
+    database.execute("SELECT * FROM some_table")
+    assert database.cursor.execute.called is True
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 def test_execute_no_connection_exception(credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        test = Database(dbapi=dbapi, **credentials)
-        test.conn = None
-        test.cursor = None
-        with pytest.raises(DBError):
-            test.execute("SELECT * FROM some_table")
-
-
-@pytest.mark.parametrize("dbapi", DBAPIS)
-def test_execute_sql_exception(credentials, dbapi):
-    with (
-        mock.patch(dbapi.__name__ + ".connect") as mock_connect,
-        Database(dbapi=dbapi, **credentials) as test,
-    ):
-        test.cursor.execute.side_effect = Exception("SQL Exception")
-        with pytest.raises(DBError):
-            test.execute("SELECT * FROM some_table")
-
-
-@pytest.mark.parametrize("dbapi", DBAPIS)
-def test_to_dataframe_all_pandas(credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        mock_connect.return_value.cursor.return_value.fetchall.return_value = [
+    test = Database(dbapi=dbapi, **credentials)
+    test.conn = None
+    test.cursor = None
+    with pytest.raises(DBError):
+        test.execute("SELECT * FROM some_table")
+
+
+def test_execute_sql_exception(database):
+    database.cursor.execute.side_effect = Exception("SQL Exception")
+    with pytest.raises(DBError):
+        database.execute("SELECT * FROM some_table")
+
+
+def test_to_dataframe_all_pandas(database):
+    database.cursor.fetchall.return_value = [
+        (1, 2),
+        (2, 3),
+        (3,),
+    ]
+    expected_df = pd.DataFrame(
+        [
             (1, 2),
             (2, 3),
             (3,),
         ]
-        expected_df = pd.DataFrame(
-            [
-                (1, 2),
-                (2, 3),
-                (3,),
-            ]
-        )
-        with Database(dbapi=dbapi, **credentials) as test:
-            test.execute("SELECT 'hello world' AS fld")
-            df = test.to_dataframe(df_type="pandas")
-        pd.testing.assert_frame_equal(df, expected_df)
-    assert mock_connect.return_value.cursor.return_value.fetchall.called
+    )
+    database.execute("SELECT 'hello world' AS fld")
+    df = database.to_dataframe(df_type="pandas")
+    pd.testing.assert_frame_equal(df, expected_df)
+    assert database.cursor.fetchall.called
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
-def test_to_dataframe_custom_size(credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        mock_connect.return_value.cursor.return_value.fetchmany.return_value = [
+def test_to_dataframe_custom_size(database):
+    database.cursor.fetchmany.return_value = [
+        (1, 2),
+        (2, 3),
+        (3,),
+    ]
+    expected_df = pd.DataFrame(
+        [
             (1, 2),
             (2, 3),
             (3,),
         ]
-        expected_df = pd.DataFrame(
-            [
-                (1, 2),
-                (2, 3),
-                (3,),
-            ]
-        )
-        with Database(dbapi=dbapi, **credentials) as test:
-            test.execute("SELECT 'hello world' AS fld")
-            df = test.to_dataframe(size=5)
-        pd.testing.assert_frame_equal(df, expected_df)
-    mock_connect.return_value.cursor.return_value.fetchmany.assert_called_with(5)
-
-
-@pytest.mark.parametrize("dbapi", DBAPIS)
-@mock.patch("pandas.DataFrame")
-def test_to_dataframe_none(mock_pandas, credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        mock_connect.return_value.cursor.return_value.fetchmany.return_value = []
-        with Database(dbapi=dbapi, **credentials) as test:
-            test.execute("SELECT 'hello world' WHERE 1=0")
-            assert test.to_dataframe(size=5) is None
-            mock_pandas.assert_not_called()
-
-
-@pytest.mark.parametrize("dbapi", DBAPIS)
-def test_to_dataframe_all_polars(credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        mock_connect.return_value.cursor.return_value.fetchall.return_value = [
-            (1, 2),
-            (2, 3),
-            (3, 4),
-        ]
-        expected_df = pl.DataFrame([[1, 2, 3], [2, 3, 4]])
-        with Database(dbapi=dbapi, **credentials) as test:
-            test.execute("SELECT 'hello world' AS fld")
-            df = test.to_dataframe(df_type="polars")
-        pltest.assert_frame_equal(df, expected_df)
+    )
+    database.execute("SELECT 'hello world' AS fld")
+    df = database.to_dataframe(size=5)
+    pd.testing.assert_frame_equal(df, expected_df)
+    database.cursor.fetchmany.assert_called_with(5)
 
-    assert mock_connect.return_value.cursor.return_value.fetchall.called
 
+@mock.patch("pandas.DataFrame.from_records")
+def test_to_dataframe_from_records(mock_from_records, database):
+    database.cursor.description = [
+        ("COL1",),
+        ("COL2",),
+    ]
+    database.cursor.fetchall.return_value = [
+        [1, 2],
+        [2, 3],
+    ]
+    database.execute("SELECT 'hello world' AS fld")
+    database.to_dataframe()
+    mock_from_records.assert_called_with([(1, 2), (2, 3)], columns=["col1", "col2"])
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
-def test_to_dataframe_error(credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        mock_connect.return_value.cursor.return_value.fetchall.return_value = [
-            (1, 2),
-            (2, 3),
-            (3, 4),
-        ]
-        with Database(dbapi=dbapi, **credentials) as test:
-            test.execute("SELECT 'hello world' AS fld")
-            with pytest.raises(ValueError):
-                test.to_dataframe(df_type="invalid")
-
-
-@pytest.mark.parametrize("dbapi", DBAPIS)
-def test_get_column_names(credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        mock_connect.return_value.cursor.return_value.description = [["COL1"], ["COL2"]]
-        with Database(dbapi=dbapi, **credentials) as test:
-            assert test.column_names() == ["col1", "col2"]
-
-        mock_connect.return_value.cursor.return_value.description = [
-            ("COL1",),
-            ("COL2",),
-        ]
-        with Database(dbapi=dbapi, **credentials) as test:
-            assert test.column_names() == ["col1", "col2"]
 
-        mock_connect.return_value.cursor.return_value.description = (
-            ("COL1",),
-            ("COL2",),
-        )
-        with Database(dbapi=dbapi, **credentials) as test:
-            assert test.column_names() == ["col1", "col2"]
+def test_to_dataframe_pyarrow(database):
+    database.cursor.description = [
+        ("COL1",),
+        ("COL2",),
+    ]
+    database.cursor.fetchall.return_value = [
+        (1, "a"),
+        (2, "b"),
+    ]
+    database.execute("SELECT 'hello world' AS fld")
+    df = database.to_dataframe(dtype_backend="pyarrow")
+    with pytest.raises(ValueError):
+        database.to_dataframe(dtype_backend="invalid")
+    assert list(df.columns) == ["col1", "col2"]
+    assert isinstance(df["col2"].dtype, pd.ArrowDtype)
+    assert df["col1"].tolist() == [1, 2]
+    assert df["col2"].tolist() == ["a", "b"]
+
+
+def test_to_dataframe_pyarrow_no_description(database):
+    database.cursor.description = []
+    database.cursor.fetchall.return_value = [
+        (1, "a"),
+        (2, "b"),
+    ]
+    database.execute("SELECT 'hello world' AS fld")
+    df = database.to_dataframe(dtype_backend="pyarrow")
+    # the same integer labels as the default and fallback paths
+    assert df.columns.equals(database.to_dataframe().columns)
+    assert list(df.columns) == [0, 1]
+    assert df[1].tolist() == ["a", "b"]
+
+
+def test_to_dataframe_pyarrow_mixed_types(database):
+    database.cursor.description = [
+        ("COL1",),
+        ("COL2",),
+    ]
+    database.cursor.fetchall.return_value = [
+        (1, "a"),
+        (2, 3),
+    ]
+    database.execute("SELECT 'hello world' AS fld")
+    df = database.to_dataframe(dtype_backend="pyarrow")
+    assert list(df.columns) == ["col1", "col2"]
+    assert isinstance(df["col1"].dtype, pd.ArrowDtype)
+    assert df["col1"].tolist() == [1, 2]
+    assert df["col2"].tolist() == ["a", 3]
+
+
+@mock.patch("pandas.DataFrame.from_records")
+def test_to_dataframe_none(mock_pandas, database):
+    database.cursor.fetchmany.return_value = []
+    database.execute("SELECT 'hello world' WHERE 1=0")
+    assert database.to_dataframe(size=5) is None
+    mock_pandas.assert_not_called()
+
+
+def test_to_dataframe_all_polars(database):
+    database.cursor.fetchall.return_value = [
+        (1, 2),
+        (2, 3),
+        (3, 4),
+    ]
+    expected_df = pl.DataFrame([[1, 2, 3], [2, 3, 4]])
+    database.execute("SELECT 'hello world' AS fld")
+    df = database.to_dataframe(df_type="polars")
+    pltest.assert_frame_equal(df, expected_df)
+
+    assert database.cursor.fetchall.called
+
+
+def test_to_dataframe_error(database):
+    database.cursor.fetchall.return_value = [
+        (1, 2),
+        (2, 3),
+        (3, 4),
+    ]
+    database.execute("SELECT 'hello world' AS fld")
+    with pytest.raises(ValueError):
+        database.to_dataframe(df_type="invalid")
+
+
+def test_get_column_names(database):
+    database.cursor.description = [["COL1"], ["COL2"]]
+    assert database.column_names() == ["col1", "col2"]
+
+    database.cursor.description = [
+        ("COL1",),
+        ("COL2",),
+    ]
+    assert database.column_names() == ["col1", "col2"]
+
+    database.cursor.description = (
+        ("COL1",),
+        ("COL2",),
+    )
+    assert database.column_names() == ["col1", "col2"]
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 def test_to_dict(credentials, dbapi):
     def cols():
         return ["col1", "col2"]
@@ -33,15 +33,15 @@ import psycopg2
 import pytest
 
 DBAPIS = [pg8000, psycopg2]
-INTEGRATION_CREDS = str(Path.home()) + "/.locopyrc"
+INTEGRATION_CREDS = str(Path.home() / ".locopyrc")
 S3_BUCKET = "locopy-integration-testing"
-CURR_DIR = os.path.dirname(os.path.abspath(__file__))
-LOCAL_FILE = os.path.join(CURR_DIR, "data", "mock_file.txt")
-LOCAL_FILE_HEADER = os.path.join(CURR_DIR, "data", "mock_file_header.txt")
-LOCAL_FILE_DL = os.path.join(CURR_DIR, "data", "mock_file_dl.txt")
-UNLOAD_PATH = os.path.join(CURR_DIR, "data", "unload_path")
-TEST_DF = pd.read_csv(os.path.join(CURR_DIR, "data", "mock_dataframe.txt"), sep=",")
-TEST_DF_2 = pd.read_csv(os.path.join(CURR_DIR, "data", "mock_dataframe_2.txt"), sep=",")
+DATA_DIR = Path(__file__).resolve().parent / "data"
+LOCAL_FILE = str(DATA_DIR / "mock_file.txt")
+LOCAL_FILE_HEADER = str(DATA_DIR / "mock_file_header.txt")
+LOCAL_FILE_DL = str(DATA_DIR / "mock_file_dl.txt")
+UNLOAD_PATH = str(DATA_DIR / "unload_path")
+TEST_DF = pd.read_csv(DATA_DIR / "mock_dataframe.txt", sep=",", engine="pyarrow")
+TEST_DF_2 = pd.read_csv(DATA_DIR / "mock_dataframe_2.txt", sep=",", engine="pyarrow")
 
 CREDS_DICT = locopy.utility.read_config_yaml(INTEGRATION_CREDS)
 
@@ -122,9 +122,7 @@ def test_copy(s3_bucket, dbapi):
             (4, "This is lïne 4"),
         ]
 
-        for i, result in enumerate(results):
-            assert result[0] == expected[i][0]
-            assert result[1] == expected[i][1]
+        assert [tuple(r) for r in results] == expected
 
 
 @pytest.mark.integration
@@ -154,9 +152,8 @@ def test_copy_split_ignore(s3_bucket, dbapi):
             (4, "This is lïne 4"),
         ]
 
-        for i, result in enumerate(results):
-            assert result[0] == expected[i][0]
-            assert result[1] == expected[i][1]
+        assert [tuple(r) for r in results] == expected
+        for i in range(len(expected)):
             os.remove(LOCAL_FILE_HEADER + f".{i}")
 
 
@@ -235,11 +232,7 @@ def test_insert_dataframe_to_table(s3_bucket, dbapi):
             (2, "y", pd.to_datetime("2001-04-02").date()),
         ]
 
-        assert len(expected) == len(results)
-        for i, result in enumerate(results):
-            assert result[0] == expected[i][0]
-            assert result[1] == expected[i][1]
-            assert result[2] == expected[i][2]
+        assert [tuple(r) for r in results] == expected
 
         redshift.insert_dataframe_to_table(
             TEST_DF_2, "locopy_test_2", create=True, batch_size=3
@@ -258,10 +251,7 @@ def test_insert_dataframe_to_table(s3_bucket, dbapi):
             (7, "g"),
         ]
 
-        assert len(expected) == len(results)
-        for i, result in enumerate(results):
-            assert result[0] == expected[i][0]
-            assert result[1] == expected[i][1]
+        assert [tuple(r) for r in results] == expected
 
         from decimal import Decimal
 
@@ -284,10 +274,4 @@ def test_insert_dataframe_to_table(s3_bucket, dbapi):
             (2, pd.to_datetime("2019-01-01"), False, 3, "x'y"),
         ]
 
-        assert len(expected) == len(results)
-        for i, result in enumerate(results):
-            assert result[0] == expected[i][0]
-            assert result[1] == expected[i][1]
-            assert result[2] == expected[i][2]
-            assert result[3] == expected[i][3]
-            assert result[4] == expected[i][4]
+        assert [tuple(r) for r in results] == expected
@@ -33,14 +33,14 @@ import pytest
 import snowflake.connector
 
 DBAPIS = [snowflake.connector]
-INTEGRATION_CREDS = str(Path.home()) + os.sep + ".locopy-sfrc"
+INTEGRATION_CREDS = str(Path.home() / ".locopy-sfrc")
 S3_BUCKET = "locopy-integration-testing"
-CURR_DIR = os.path.dirname(os.path.abspath(__file__))
-LOCAL_FILE = os.path.join(CURR_DIR, "data", "mock_file.txt")
-LOCAL_FILE_JSON = os.path.join(CURR_DIR, "data", "mock_file.json")
-LOCAL_FILE_DL = os.path.join(CURR_DIR, "data", "mock_file_dl.txt")
-TEST_DF = pd.read_csv(os.path.join(CURR_DIR, "data", "mock_dataframe.txt"), sep=",")
-TEST_DF_2 = pd.read_csv(os.path.join(CURR_DIR, "data", "mock_dataframe_2.txt"), sep=",")
+DATA_DIR = Path(__file__).resolve().parent / "data"
+LOCAL_FILE = str(DATA_DIR / "mock_file.txt")
+LOCAL_FILE_JSON = str(DATA_DIR / "mock_file.json")
+LOCAL_FILE_DL = str(DATA_DIR / "mock_file_dl.txt")
+TEST_DF = pd.read_csv(DATA_DIR / "mock_dataframe.txt", sep=",", engine="pyarrow")
+TEST_DF_2 = pd.read_csv(DATA_DIR / "mock_dataframe_2.txt", sep=",", engine="pyarrow")
 
 CREDS_DICT = locopy.utility.read_config_yaml(INTEGRATION_CREDS)
 
@@ -100,7 +100,7 @@ def test_upload_download_internal(dbapi):
         assert res[0][0] == "staged/mock_file_dl.txt"
 
         test.download_from_internal(
-            "@~/staged/mock_file_dl.txt", os.path.dirname(LOCAL_FILE_DL) + os.sep
+            "@~/staged/mock_file_dl.txt", str(DATA_DIR) + os.sep
         )
         assert filecmp.cmp(LOCAL_FILE, LOCAL_FILE_DL)
 
@@ -133,9 +133,7 @@ def test_copy(dbapi):
             (4, "This is lïne 4"),
         ]
 
-        for i, result in enumerate(results):
-            assert result[0] == expected[i][0]
-            assert result[1] == expected[i][1]
+        assert [tuple(r) for r in results] == expected
 
 
 @pytest.mark.integration
@@ -164,9 +162,7 @@ def test_copy_json(dbapi):
             ('"Winchester"', '"89921"'),
         ]
 
-        for i, result in enumerate(results):
-            assert result[0] == expected[i][0]
-            assert result[1] == expected[i][1]
+        assert [tuple(r) for r in results] == expected
 
 
 @pytest.mark.integration
@@ -244,11 +240,7 @@ def test_insert_dataframe_to_table(dbapi):
             (2, "y", pd.to_datetime("2001-04-02").date()),
         ]
 
-        assert len(expected) == len(results)
-        for i, result in enumerate(results):
-            assert result[0] == expected[i][0]
-            assert result[1] == expected[i][1]
-            assert result[2] == expected[i][2]
+        assert [tuple(r) for r in results] == expected
 
         test.insert_dataframe_to_table(TEST_DF_2, "test_2", create=True)
         test.execute("SELECT col1, col2 FROM test_2 ORDER BY col1 ASC")
@@ -265,10 +257,7 @@ def test_insert_dataframe_to_table(dbapi):
             (7, "g"),
         ]
 
-        assert len(expected) == len(results)
-        for i, result in enumerate(results):
-            assert result[0] == expected[i][0]
-            assert result[1] == expected[i][1]
+        assert [tuple(r) for r in results] == expected
 
         from decimal import Decimal
 
@@ -291,7 +280,4 @@ def test_insert_dataframe_to_table(dbapi):
             (2, pd.to_datetime("2019-01-01"), 3.5, 3, "1"),
         ]
 
-        assert len(expected) == len(results)
-        for i, result in enumerate(results):
-            for j, _item in enumerate(result):
-                assert result[j] == expected[i][j]
+        assert [tuple(r) for r in results] == expected
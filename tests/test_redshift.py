@@ -22,25 +22,166 @@
 
 import os
 from collections import OrderedDict
+from contextlib import ExitStack
+from types import SimpleNamespace
 from unittest import mock
 
 import locopy
-import pg8000
-import psycopg2
 import pytest
-from locopy import Redshift
+from locopy import S3, Redshift
 from locopy.errors import DBError
 
 PROFILE = "test"
-GOOD_CONFIG_YAML = """
-host: host
-port: port
-database: database
-user: user
-password: password"""
-
-DBAPIS = [pg8000, psycopg2]
+GOOD_CONFIG = {
+    "host": "host",
+    "port": "port",
+    "database": "database",
+    "user": "user",
+    "password": "password",
+}
+
+DBAPIS = ["pg8000", "psycopg2"]
+
+# extra connect kwargs Redshift.connect adds per driver
+EXPECTED_SSL_KWARGS = {
+    "pg8000": {"ssl_context": True},
+    "psycopg2": {"sslmode": "require"},
+}
 CURR_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_COPY_OPTIONS_SQL = "DATEFORMAT 'auto' COMPUPDATE ON TRUNCATECOLUMNS"
+
+SPLIT_FILES = ["/path/local_file.0", "/path/local_file.1", "/path/local_file.2"]
+SPLIT_FILES_GZIP = [
+    "/path/local_file.0.gz",
+    "/path/local_file.1.gz",
+    "/path/local_file.2.gz",
+]
+
+
+def _upload_calls(suffix="", folder=""):
+    return [
+        mock.call(
+            f"/path/local_file.{i}{suffix}",
+            "s3_bucket",
+            f"{folder}local_file.{i}{suffix}",
+        )
+        for i in range(3)
+    ]
+
+
+EXPECTED_CALLS_NO_FOLDER = _upload_calls()
+EXPECTED_CALLS_NO_FOLDER_GZIP = _upload_calls(suffix=".gz")
+EXPECTED_CALLS_FOLDER = _upload_calls(folder="test/")
+EXPECTED_CALLS_FOLDER_GZIP = _upload_calls(suffix=".gz", folder="test/")
+
+
+def _delete_calls(suffix="", folder=""):
+    return [mock.call("s3_bucket", f"{folder}local_file.{i}{suffix}") for i in range(3)]
+
+
+EXPECTED_DELETES_NO_FOLDER_GZIP = _delete_calls(suffix=".gz")
+EXPECTED_DELETES_FOLDER = _delete_calls(folder="test/")
+
+
+@pytest.fixture(scope="module", params=DBAPIS)
+def dbapi(request):
+    return pytest.importorskip(request.param)
+
+
+def _new_redshift():
+    # S3 staging and cursor handling do not depend on the driver, so these
+    # tests run against pg8000 only
+    dbapi = pytest.importorskip("pg8000")
+    with mock.patch("locopy.s3.Session"):
+        return Redshift(dbapi=dbapi, **GOOD_CONFIG)
+
+
+# a fresh instance per test keeps connections and cached column names from
+# leaking between tests
+@pytest.fixture
+def redshift():
+    return _new_redshift()
+
+
+@pytest.fixture
+def connected_redshift(patch_connect):
+    r = _new_redshift()
+    patch_connect(r.dbapi)
+    r.connect()
+    yield r
+    r.disconnect()
+
+
+@pytest.fixture
+def load_copy_mocks():
+    with ExitStack() as stack:
+        functions = stack.enter_context(
+            mock.patch.multiple(
+                "locopy.redshift",
+                split_file=mock.DEFAULT,
+                compress_file_list=mock.DEFAULT,
+            )
+        )
+        methods = stack.enter_context(
+            mock.patch.multiple(
+                Redshift,
+                delete_from_s3=mock.DEFAULT,
+                upload_to_s3=mock.DEFAULT,
+                copy=mock.DEFAULT,
+            )
+        )
+        yield SimpleNamespace(
+            split_file=functions["split_file"],
+            compress_file_list=functions["compress_file_list"],
+            session=stack.enter_context(mock.patch("locopy.s3.Session")),
+            s3_delete=methods["delete_from_s3"],
+            s3_upload=methods["upload_to_s3"],
+            rs_copy=methods["copy"],
+        )
+
+
+@pytest.fixture
+def unload_copy_mocks():
+    with ExitStack() as stack:
+        functions = stack.enter_context(
+            mock.patch.multiple(
+                "locopy.redshift",
+                write_file=mock.DEFAULT,
+                concatenate_files=mock.DEFAULT,
+            )
+        )
+        methods = stack.enter_context(
+            mock.patch.multiple(
+                Redshift,
+                unload=mock.DEFAULT,
+                _unload_generated_files=mock.DEFAULT,
+                _get_column_names=mock.DEFAULT,
+            )
+        )
+        s3_methods = stack.enter_context(
+            mock.patch.multiple(
+                S3,
+                _generate_unload_path=mock.DEFAULT,
+                download_list_from_s3=mock.DEFAULT,
+                delete_list_from_s3=mock.DEFAULT,
+            )
+        )
+        mocks = SimpleNamespace(
+            session=stack.enter_context(mock.patch("locopy.s3.Session")),
+            generate_unload_path=s3_methods["_generate_unload_path"],
+            unload=methods["unload"],
+            unload_generated_files=methods["_unload_generated_files"],
+            get_col_names=methods["_get_column_names"],
+            download_list_from_s3=s3_methods["download_list_from_s3"],
+            write=functions["write_file"],
+            delete_list_from_s3=s3_methods["delete_list_from_s3"],
+            concat=functions["concatenate_files"],
+        )
+        mocks.generate_unload_path.return_value = "dummy_s3_path"
+        mocks.get_col_names.return_value = ["dummy_col_name"]
+        mocks.unload_generated_files.return_value = ["dummy_file"]
+        mocks.download_list_from_s3.return_value = ["s3.file"]
+        yield mocks
 
 
 def test_add_default_copy_options():
@@ -60,12 +201,12 @@ def test_add_default_copy_options():
 
 
 def test_combine_copy_options():
-    assert locopy.redshift.combine_copy_options(
-        locopy.redshift.add_default_copy_options()
-    ) == ("DATEFORMAT 'auto' COMPUPDATE " "ON TRUNCATECOLUMNS")
+    assert (
+        locopy.redshift.combine_copy_options(locopy.redshift.add_default_copy_options())
+        == DEFAULT_COPY_OPTIONS_SQL
+    )
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 @mock.patch("locopy.s3.Session")
 def test_constructor(mock_session, credentials, dbapi):
     r = Redshift(profile=PROFILE, dbapi=dbapi, **credentials)
@@ -79,17 +220,16 @@ def test_constructor(mock_session, credentials, dbapi):
     assert r.connection["password"] == "password"
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 def test_constructor_credential_error(credentials, dbapi, caplog):
     r = Redshift(dbapi=dbapi, **credentials)
     assert "S3 credentials were not found. S3 functionality is disabled" in caplog.text
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
-@mock.patch("locopy.utility.open", mock.mock_open(read_data=GOOD_CONFIG_YAML))
+@mock.patch("locopy.database.read_config_yaml", return_value=GOOD_CONFIG)
 @mock.patch("locopy.s3.Session")
-def test_constructor_yaml(mock_session, dbapi):
+def test_constructor_yaml(mock_session, mock_read_config_yaml, dbapi):
     r = Redshift(profile=PROFILE, dbapi=dbapi, config_yaml="some_config.yml")
+    mock_read_config_yaml.assert_called_with("some_config.yml")
     mock_session.assert_called_with(profile_name=PROFILE)
     assert r.profile == PROFILE
     assert r.kms_key is None
@@ -100,932 +240,975 @@ def test_constructor_yaml(mock_session, dbapi):
     assert r.connection["password"] == "password"
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 @mock.patch("locopy.s3.Session")
-def test_redshift_connect(mock_session, credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        r = Redshift(profile=PROFILE, dbapi=dbapi, **credentials)
-        r.connect()
+def test_redshift_connect(mock_session, mock_connect, credentials, dbapi):
+    r = Redshift(profile=PROFILE, dbapi=dbapi, **credentials)
+    r.connect()
 
-        if dbapi.__name__ == "pg8000":
-            mock_connect.assert_called_with(
-                host="host",
-                user="user",
-                port="port",
-                password="password",
-                database="database",
-                ssl_context=True,
-            )
-        else:
-            mock_connect.assert_called_with(
-                host="host",
-                user="user",
-                port="port",
-                password="password",
-                database="database",
-                sslmode="require",
-            )
-        r.conn.cursor.assert_called_with()
+    mock_connect.assert_called_with(
+        **credentials, **EXPECTED_SSL_KWARGS[dbapi.__name__]
+    )
+    r.conn.cursor.assert_called_with()
 
-        # side effect exception
-        mock_connect.side_effect = Exception("Connect Exception")
-        with pytest.raises(DBError):
-            r.connect()
+    # side effect exception
+    mock_connect.side_effect = Exception("Connect Exception")
+    with pytest.raises(DBError):
+        r.connect()
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 @mock.patch("locopy.s3.Session")
 @mock.patch("locopy.redshift.Redshift.execute")
-def test_copy_parquet(mock_execute, mock_session, credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        r = Redshift(profile=PROFILE, dbapi=dbapi, **credentials)
-        r.connect()
-        r.copy("table", s3path="path", delim=None, copy_options=["PARQUET"])
-        test_sql = "COPY {} FROM '{}' " "CREDENTIALS '{}' " "{};".format(
-            "table", "path", r._credentials_string(), "PARQUET"
-        )
-        assert mock_execute.called_with(test_sql, commit=True)
-        mock_execute.reset_mock()
-        mock_session.reset_mock()
-        r.copy("table", s3path="path", delim=None)
-        test_sql = "COPY {} FROM '{}' " "CREDENTIALS '{}' " "{};".format(
-            "table",
-            "path",
-            r._credentials_string(),
-            locopy.redshift.add_default_copy_options(),
-        )
-        assert mock_execute.called_with(test_sql, commit=True)
+def test_copy_parquet(mock_execute, mock_session, mock_connect, credentials, dbapi):
+    r = Redshift(profile=PROFILE, dbapi=dbapi, **credentials)
+    r.connect()
+    creds_str = r._credentials_string()
+    r.copy("table", s3path="path", delim=None, copy_options=["PARQUET"])
+    test_sql = "COPY {} FROM '{}' " "CREDENTIALS '{}' " "{};".format(
+        "table", "path", creds_str, "PARQUET"
+    )
+    mock_execute.assert_called_with(test_sql, commit=True)
+    mock_execute.reset_mock()
+    mock_session.reset_mock()
+    r.copy("table", s3path="path", delim=None)
+    test_sql = "COPY {} FROM '{}' " "CREDENTIALS '{}' " "{};".format(
+        "table",
+        "path",
+        creds_str,
+        DEFAULT_COPY_OPTIONS_SQL,
+    )
+    mock_execute.assert_called_with(test_sql, commit=True)
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
-@mock.patch("locopy.utility.os.remove")
-@mock.patch("locopy.redshift.Redshift.copy")
-@mock.patch("locopy.redshift.Redshift.upload_to_s3")
-@mock.patch("locopy.redshift.Redshift.delete_from_s3")
-@mock.patch("locopy.s3.Session")
-@mock.patch("locopy.redshift.compress_file_list")
-@mock.patch("locopy.redshift.split_file")
-def test_load_and_copy(
-    mock_split_file,
-    mock_compress_file_list,
-    mock_session,
-    mock_s3_delete,
-    mock_s3_upload,
-    mock_rs_copy,
-    mock_remove,
-    credentials,
-    dbapi,
-):
-    def reset_mocks():
-        mock_split_file.reset_mock()
-        mock_compress_file_list.reset_mock()
-        mock_s3_upload.reset_mock()
-        mock_s3_delete.reset_mock()
-        mock_rs_copy.reset_mock()
-        mock_remove.reset_mock()
-
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        r = Redshift(dbapi=dbapi, **credentials)
-        r.connect()
+def test_load_and_copy_single_gzip(load_copy_mocks, redshift):
+    load_copy_mocks.split_file.return_value = ["/path/local_file.txt"]
+    load_copy_mocks.compress_file_list.return_value = ["/path/local_file.txt.gz"]
+    redshift.load_and_copy("/path/local_file.txt", "s3_bucket", "table_name", delim="|")
 
-        expected_calls_no_folder = [
-            mock.call("/path/local_file.0", "s3_bucket", "local_file.0"),
-            mock.call("/path/local_file.1", "s3_bucket", "local_file.1"),
-            mock.call("/path/local_file.2", "s3_bucket", "local_file.2"),
-        ]
-
-        expected_calls_no_folder_gzip = [
-            mock.call("/path/local_file.0.gz", "s3_bucket", "local_file.0.gz"),
-            mock.call("/path/local_file.1.gz", "s3_bucket", "local_file.1.gz"),
-            mock.call("/path/local_file.2.gz", "s3_bucket", "local_file.2.gz"),
-        ]
-
-        expected_calls_folder = [
-            mock.call("/path/local_file.0", "s3_bucket", "test/local_file.0"),
-            mock.call("/path/local_file.1", "s3_bucket", "test/local_file.1"),
-            mock.call("/path/local_file.2", "s3_bucket", "test/local_file.2"),
-        ]
-
-        expected_calls_folder_gzip = [
-            mock.call("/path/local_file.0.gz", "s3_bucket", "test/local_file.0.gz"),
-            mock.call("/path/local_file.1.gz", "s3_bucket", "test/local_file.1.gz"),
-            mock.call("/path/local_file.2.gz", "s3_bucket", "test/local_file.2.gz"),
-        ]
-
-        mock_split_file.return_value = ["/path/local_file.txt"]
-        mock_compress_file_list.return_value = ["/path/local_file.txt.gz"]
-        r.load_and_copy("/path/local_file.txt", "s3_bucket", "table_name", delim="|")
-
-        # assert
-        assert mock_split_file.called
-        mock_compress_file_list.assert_called_with(["/path/local_file.txt"])
-        # mock_remove.assert_called_with("/path/local_file.txt")
-        mock_s3_upload.assert_called_with(
-            "/path/local_file.txt.gz", "s3_bucket", "local_file.txt.gz"
-        )
-        mock_rs_copy.assert_called_with(
-            "table_name", "s3://s3_bucket/local_file", "|", copy_options=["GZIP"]
-        )
-        assert not mock_s3_delete.called, "Only delete when explicit"
-
-        reset_mocks()
-        mock_split_file.return_value = [
-            "/path/local_file.0",
-            "/path/local_file.1",
-            "/path/local_file.2",
-        ]
-        mock_compress_file_list.return_value = [
-            "/path/local_file.0.gz",
-            "/path/local_file.1.gz",
-            "/path/local_file.2.gz",
-        ]
-        r.load_and_copy(
-            "/path/local_file",
-            "s3_bucket",
-            "table_name",
-            delim="|",
-            copy_options=["SOME OPTION"],
-            splits=3,
-            delete_s3_after=True,
-        )
+    assert load_copy_mocks.split_file.called
+    load_copy_mocks.compress_file_list.assert_called_with(["/path/local_file.txt"])
+    load_copy_mocks.s3_upload.assert_called_with(
+        "/path/local_file.txt.gz", "s3_bucket", "local_file.txt.gz"
+    )
+    load_copy_mocks.rs_copy.assert_called_with(
+        "table_name", "s3://s3_bucket/local_file", "|", copy_options=["GZIP"]
+    )
+    assert not load_copy_mocks.s3_delete.called, "Only delete when explicit"
+
+
+def test_load_and_copy_splits_gzip_delete(load_copy_mocks, redshift):
+    load_copy_mocks.split_file.return_value = SPLIT_FILES
+    load_copy_mocks.compress_file_list.return_value = SPLIT_FILES_GZIP
+    redshift.load_and_copy(
+        "/path/local_file",
+        "s3_bucket",
+        "table_name",
+        delim="|",
+        copy_options=["SOME OPTION"],
+        splits=3,
+        delete_s3_after=True,
+    )
 
-        # assert
-        mock_split_file.assert_called_with(
-            "/path/local_file", "/path/local_file", splits=3, ignore_header=0
-        )
-        mock_compress_file_list.assert_called_with(
-            ["/path/local_file.0", "/path/local_file.1", "/path/local_file.2"]
-        )
-        # mock_remove.assert_called_with("/path/local_file.2")
-        mock_s3_upload.assert_has_calls(expected_calls_no_folder_gzip)
-        mock_rs_copy.assert_called_with(
-            "table_name",
-            "s3://s3_bucket/local_file",
-            "|",
-            copy_options=["SOME OPTION", "GZIP"],
-        )
-        assert mock_s3_delete.called_with("s3_bucket", "local_file.0.gz")
-        assert mock_s3_delete.called_with("s3_bucket", "local_file.1.gz")
-        assert mock_s3_delete.called_with("s3_bucket", "local_file.2.gz")
-
-        reset_mocks()
-        mock_split_file.return_value = ["/path/local_file"]
-        mock_compress_file_list.return_value = ["/path/local_file.gz"]
-        r.load_and_copy(
-            "/path/local_file",
-            "s3_bucket",
-            "table_name",
-            delim=",",
-            copy_options=["SOME OPTION"],
-            compress=False,
-        )
-        # assert
-        assert mock_split_file.called
-        assert not mock_compress_file_list.called
-        # assert not mock_remove.called
-        mock_s3_upload.assert_called_with("/path/local_file", "s3_bucket", "local_file")
-        mock_rs_copy.assert_called_with(
-            "table_name", "s3://s3_bucket/local_file", ",", copy_options=["SOME OPTION"]
-        )
-        assert not mock_s3_delete.called, "Only delete when explicit"
-
-        reset_mocks()
-        mock_split_file.return_value = [
-            "/path/local_file.0",
-            "/path/local_file.1",
-            "/path/local_file.2",
-        ]
-        r.load_and_copy(
-            "/path/local_file",
-            "s3_bucket",
-            "table_name",
-            delim="|",
-            copy_options=["SOME OPTION"],
-            splits=3,
-            compress=False,
-        )
-        # assert
-        mock_split_file.assert_called_with(
-            "/path/local_file", "/path/local_file", splits=3, ignore_header=0
-        )
-        assert not mock_compress_file_list.called
-        # assert not mock_remove.called
-        mock_s3_upload.assert_has_calls(expected_calls_no_folder)
-        mock_rs_copy.assert_called_with(
-            "table_name", "s3://s3_bucket/local_file", "|", copy_options=["SOME OPTION"]
-        )
-        assert not mock_s3_delete.called
+    load_copy_mocks.split_file.assert_called_with(
+        "/path/local_file", "/path/local_file", splits=3, ignore_header=0
+    )
+    load_copy_mocks.compress_file_list.assert_called_with(SPLIT_FILES)
+    assert load_copy_mocks.s3_upload.call_args_list == EXPECTED_CALLS_NO_FOLDER_GZIP
+    load_copy_mocks.rs_copy.assert_called_with(
+        "table_name",
+        "s3://s3_bucket/local_file",
+        "|",
+        copy_options=["SOME OPTION", "GZIP"],
+    )
+    assert load_copy_mocks.s3_delete.call_args_list == EXPECTED_DELETES_NO_FOLDER_GZIP
+
+
+def test_load_and_copy_no_compress(load_copy_mocks, redshift):
+    load_copy_mocks.split_file.return_value = ["/path/local_file"]
+    load_copy_mocks.compress_file_list.return_value = ["/path/local_file.gz"]
+    redshift.load_and_copy(
+        "/path/local_file",
+        "s3_bucket",
+        "table_name",
+        delim=",",
+        copy_options=["SOME OPTION"],
+        compress=False,
+    )
 
-        # with a s3_folder included and no splits
-        reset_mocks()
-        mock_split_file.return_value = ["/path/local_file.txt"]
-        r.load_and_copy(
-            "/path/local_file.txt",
-            "s3_bucket",
-            "table_name",
-            delim="|",
-            copy_options=["SOME OPTION"],
-            compress=False,
-            s3_folder="test",
-        )
-        # assert
-        assert mock_split_file.called
-        assert not mock_compress_file_list.called
-        # assert not mock_remove.called
-        mock_s3_upload.assert_called_with(
-            "/path/local_file.txt", "s3_bucket", "test/local_file.txt"
-        )
-        mock_rs_copy.assert_called_with(
-            "table_name",
-            "s3://s3_bucket/test/local_file",
-            "|",
-            copy_options=["SOME OPTION"],
-        )
-        assert not mock_s3_delete.called
-
-        # with a s3_folder included and splits
-        reset_mocks()
-        mock_split_file.return_value = [
-            "/path/local_file.0",
-            "/path/local_file.1",
-            "/path/local_file.2",
-        ]
-
-        r.load_and_copy(
-            "/path/local_file",
-            "s3_bucket",
-            "table_name",
-            delim="|",
-            copy_options=["SOME OPTION"],
-            splits=3,
-            compress=False,
-            s3_folder="test",
-            delete_s3_after=True,
-        )
-        # assert
-        mock_split_file.assert_called_with(
-            "/path/local_file", "/path/local_file", splits=3, ignore_header=0
-        )
-        assert not mock_compress_file_list.called
-        # assert not mock_remove.called
-        mock_s3_upload.assert_has_calls(expected_calls_folder)
-        mock_rs_copy.assert_called_with(
-            "table_name",
-            "s3://s3_bucket/test/local_file",
-            "|",
-            copy_options=["SOME OPTION"],
-        )
-        assert mock_s3_delete.called_with("s3_bucket", "test/local_file.0")
-        assert mock_s3_delete.called_with("s3_bucket", "test/local_file.1")
-        assert mock_s3_delete.called_with("s3_bucket", "test/local_file.2")
-
-        # with a s3_folder included , splits, and gzip
-        reset_mocks()
-        mock_split_file.return_value = [
-            "/path/local_file.0",
-            "/path/local_file.1",
-            "/path/local_file.2",
-        ]
-        mock_compress_file_list.return_value = [
-            "/path/local_file.0.gz",
-            "/path/local_file.1.gz",
-            "/path/local_file.2.gz",
-        ]
-        r.load_and_copy(
-            "/path/local_file",
-            "s3_bucket",
-            "table_name",
-            delim="|",
-            copy_options=["SOME OPTION"],
-            splits=3,
-            s3_folder="test",
-        )
-        # assert
-        mock_split_file.assert_called_with(
-            "/path/local_file", "/path/local_file", splits=3, ignore_header=0
-        )
-        assert mock_compress_file_list.called
-        # assert mock_remove.called
-        mock_s3_upload.assert_has_calls(expected_calls_folder_gzip)
-        mock_rs_copy.assert_called_with(
-            "table_name",
-            "s3://s3_bucket/test/local_file",
-            "|",
-            copy_options=["SOME OPTION", "GZIP"],
-        )
-        assert not mock_s3_delete.called
+    assert load_copy_mocks.split_file.called
+    assert not load_copy_mocks.compress_file_list.called
+    load_copy_mocks.s3_upload.assert_called_with(
+        "/path/local_file", "s3_bucket", "local_file"
+    )
+    load_copy_mocks.rs_copy.assert_called_with(
+        "table_name", "s3://s3_bucket/local_file", ",", copy_options=["SOME OPTION"]
+    )
+    assert not load_copy_mocks.s3_delete.called, "Only delete when explicit"
+
+
+def test_load_and_copy_no_compress_splits(load_copy_mocks, redshift):
+    load_copy_mocks.split_file.return_value = SPLIT_FILES
+    redshift.load_and_copy(
+        "/path/local_file",
+        "s3_bucket",
+        "table_name",
+        delim="|",
+        copy_options=["SOME OPTION"],
+        splits=3,
+        compress=False,
+    )
 
+    load_copy_mocks.split_file.assert_called_with(
+        "/path/local_file", "/path/local_file", splits=3, ignore_header=0
+    )
+    assert not load_copy_mocks.compress_file_list.called
+    assert load_copy_mocks.s3_upload.call_args_list == EXPECTED_CALLS_NO_FOLDER
+    load_copy_mocks.rs_copy.assert_called_with(
+        "table_name", "s3://s3_bucket/local_file", "|", copy_options=["SOME OPTION"]
+    )
+    assert not load_copy_mocks.s3_delete.called
+
+
+def test_load_and_copy_s3_folder(load_copy_mocks, redshift):
+    load_copy_mocks.split_file.return_value = ["/path/local_file.txt"]
+    redshift.load_and_copy(
+        "/path/local_file.txt",
+        "s3_bucket",
+        "table_name",
+        delim="|",
+        copy_options=["SOME OPTION"],
+        compress=False,
+        s3_folder="test",
+    )
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
-@mock.patch("locopy.utility.os.remove")
-@mock.patch("locopy.redshift.Redshift.copy")
-@mock.patch("locopy.redshift.Redshift.upload_to_s3")
-@mock.patch("locopy.redshift.Redshift.delete_from_s3")
-@mock.patch("locopy.s3.Session")
-@mock.patch("locopy.redshift.compress_file_list")
-@mock.patch("locopy.redshift.split_file")
-def test_load_and_copy_split_and_header(
-    mock_split_file,
-    mock_compress_file_list,
-    mock_session,
-    mock_s3_delete,
-    mock_s3_upload,
-    mock_rs_copy,
-    mock_remove,
-    credentials,
-    dbapi,
-):
-    def reset_mocks():
-        mock_split_file.reset_mock()
-        mock_compress_file_list.reset_mock()
-        mock_s3_upload.reset_mock()
-        mock_s3_delete.reset_mock()
-        mock_rs_copy.reset_mock()
-        mock_remove.reset_mock()
-
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        r = Redshift(dbapi=dbapi, **credentials)
-        r.connect()
+    assert load_copy_mocks.split_file.called
+    assert not load_copy_mocks.compress_file_list.called
+    load_copy_mocks.s3_upload.assert_called_with(
+        "/path/local_file.txt", "s3_bucket", "test/local_file.txt"
+    )
+    load_copy_mocks.rs_copy.assert_called_with(
+        "table_name",
+        "s3://s3_bucket/test/local_file",
+        "|",
+        copy_options=["SOME OPTION"],
+    )
+    assert not load_copy_mocks.s3_delete.called
+
+
+def test_load_and_copy_s3_folder_splits_delete(load_copy_mocks, redshift):
+    load_copy_mocks.split_file.return_value = SPLIT_FILES
+    redshift.load_and_copy(
+        "/path/local_file",
+        "s3_bucket",
+        "table_name",
+        delim="|",
+        copy_options=["SOME OPTION"],
+        splits=3,
+        compress=False,
+        s3_folder="test",
+        delete_s3_after=True,
+    )
 
-        expected_calls_no_folder = [
-            mock.call("/path/local_file.0", "s3_bucket", "local_file.0"),
-            mock.call("/path/local_file.1", "s3_bucket", "local_file.1"),
-            mock.call("/path/local_file.2", "s3_bucket", "local_file.2"),
-        ]
-
-        expected_calls_no_folder_gzip = [
-            mock.call("/path/local_file.0.gz", "s3_bucket", "local_file.0.gz"),
-            mock.call("/path/local_file.1.gz", "s3_bucket", "local_file.1.gz"),
-            mock.call("/path/local_file.2.gz", "s3_bucket", "local_file.2.gz"),
-        ]
-
-        expected_calls_folder = [
-            mock.call("/path/local_file.0", "s3_bucket", "test/local_file.0"),
-            mock.call("/path/local_file.1", "s3_bucket", "test/local_file.1"),
-            mock.call("/path/local_file.2", "s3_bucket", "test/local_file.2"),
-        ]
-
-        expected_calls_folder_gzip = [
-            mock.call("/path/local_file.0.gz", "s3_bucket", "test/local_file.0.gz"),
-            mock.call("/path/local_file.1.gz", "s3_bucket", "test/local_file.1.gz"),
-            mock.call("/path/local_file.2.gz", "s3_bucket", "test/local_file.2.gz"),
-        ]
-
-        mock_split_file.return_value = ["/path/local_file.txt"]
-        mock_compress_file_list.return_value = ["/path/local_file.txt.gz"]
-
-        # neither ignore or split only
-        r.load_and_copy("/path/local_file.txt", "s3_bucket", "table_name", delim="|")
-
-        # assert
-        assert mock_split_file.called
-        mock_compress_file_list.assert_called_with(["/path/local_file.txt"])
-        # mock_remove.assert_called_with("/path/local_file.txt")
-        mock_s3_upload.assert_called_with(
-            "/path/local_file.txt.gz", "s3_bucket", "local_file.txt.gz"
-        )
-        mock_rs_copy.assert_called_with(
-            "table_name", "s3://s3_bucket/local_file", "|", copy_options=["GZIP"]
-        )
-        assert not mock_s3_delete.called, "Only delete when explicit"
+    load_copy_mocks.split_file.assert_called_with(
+        "/path/local_file", "/path/local_file", splits=3, ignore_header=0
+    )
+    assert not load_copy_mocks.compress_file_list.called
+    assert load_copy_mocks.s3_upload.call_args_list == EXPECTED_CALLS_FOLDER
+    load_copy_mocks.rs_copy.assert_called_with(
+        "table_name",
+        "s3://s3_bucket/test/local_file",
+        "|",
+        copy_options=["SOME OPTION"],
+    )
+    assert load_copy_mocks.s3_delete.call_args_list == EXPECTED_DELETES_FOLDER
+
+
+def test_load_and_copy_s3_folder_splits_gzip(load_copy_mocks, redshift):
+    load_copy_mocks.split_file.return_value = SPLIT_FILES
+    load_copy_mocks.compress_file_list.return_value = SPLIT_FILES_GZIP
+    redshift.load_and_copy(
+        "/path/local_file",
+        "s3_bucket",
+        "table_name",
+        delim="|",
+        copy_options=["SOME OPTION"],
+        splits=3,
+        s3_folder="test",
+    )
 
-        # ignore only
-        reset_mocks()
-        r.load_and_copy(
-            "/path/local_file.txt",
-            "s3_bucket",
-            "table_name",
-            delim="|",
-            copy_options=["IGNOREHEADER as 1"],
-        )
+    load_copy_mocks.split_file.assert_called_with(
+        "/path/local_file", "/path/local_file", splits=3, ignore_header=0
+    )
+    assert load_copy_mocks.compress_file_list.called
+    assert load_copy_mocks.s3_upload.call_args_list == EXPECTED_CALLS_FOLDER_GZIP
+    load_copy_mocks.rs_copy.assert_called_with(
+        "table_name",
+        "s3://s3_bucket/test/local_file",
+        "|",
+        copy_options=["SOME OPTION", "GZIP"],
+    )
+    assert not load_copy_mocks.s3_delete.called
+
+
+def test_load_and_copy_no_split_no_header(load_copy_mocks, redshift):
+    load_copy_mocks.split_file.return_value = ["/path/local_file.txt"]
+    redshift.load_and_copy(
+        "/path/local_file.txt",
+        "s3_bucket",
+        "table_name",
+        delim="|",
+        copy_options=["NULL AS 'x'"],
+        splits=1,
+        compress=False,
+    )
 
-        # assert
-        assert mock_split_file.called
-        mock_compress_file_list.assert_called_with(["/path/local_file.txt"])
-        # mock_remove.assert_called_with("/path/local_file.txt")
-        mock_s3_upload.assert_called_with(
-            "/path/local_file.txt.gz", "s3_bucket", "local_file.txt.gz"
-        )
-        mock_rs_copy.assert_called_with(
-            "table_name",
-            "s3://s3_bucket/local_file",
-            "|",
-            copy_options=["IGNOREHEADER as 1", "GZIP"],
-        )
-        assert not mock_s3_delete.called, "Only delete when explicit"
-
-        # split only
-        reset_mocks()
-        mock_split_file.return_value = [
-            "/path/local_file.0",
-            "/path/local_file.1",
-            "/path/local_file.2",
-        ]
-        mock_compress_file_list.return_value = [
-            "/path/local_file.0.gz",
-            "/path/local_file.1.gz",
-            "/path/local_file.2.gz",
-        ]
-        r.load_and_copy(
-            "/path/local_file",
-            "s3_bucket",
-            "table_name",
-            delim="|",
-            splits=3,
-            delete_s3_after=True,
-        )
+    # a single file is passed through split_file unsplit, with no header to skip
+    load_copy_mocks.split_file.assert_called_once_with(
+        "/path/local_file.txt", "/path/local_file.txt", splits=1, ignore_header=0
+    )
+    assert not load_copy_mocks.compress_file_list.called
+    load_copy_mocks.s3_upload.assert_called_once_with(
+        "/path/local_file.txt", "s3_bucket", "local_file.txt"
+    )
+    load_copy_mocks.rs_copy.assert_called_with(
+        "table_name", "s3://s3_bucket/local_file", "|", copy_options=["NULL AS 'x'"]
+    )
+    assert not load_copy_mocks.s3_delete.called, "Only delete when explicit"
+
+
+def test_load_and_copy_ignore_header_only(load_copy_mocks, redshift):
+    load_copy_mocks.split_file.return_value = ["/path/local_file.txt"]
+    load_copy_mocks.compress_file_list.return_value = ["/path/local_file.txt.gz"]
+    redshift.load_and_copy(
+        "/path/local_file.txt",
+        "s3_bucket",
+        "table_name",
+        delim="|",
+        copy_options=["IGNOREHEADER as 1"],
+    )
 
-        # assert
-        mock_split_file.assert_called_with(
-            "/path/local_file", "/path/local_file", splits=3, ignore_header=0
-        )
-        mock_compress_file_list.assert_called_with(
-            ["/path/local_file.0", "/path/local_file.1", "/path/local_file.2"]
-        )
-        mock_s3_upload.assert_has_calls(expected_calls_no_folder_gzip)
-        mock_rs_copy.assert_called_with(
-            "table_name", "s3://s3_bucket/local_file", "|", copy_options=["GZIP"]
-        )
-        assert mock_s3_delete.called_with("s3_bucket", "local_file.0.gz")
-        assert mock_s3_delete.called_with("s3_bucket", "local_file.1.gz")
-        assert mock_s3_delete.called_with("s3_bucket", "local_file.2.gz")
-
-        # split and ignore
-        reset_mocks()
-        mock_split_file.return_value = [
-            "/path/local_file.0",
-            "/path/local_file.1",
-            "/path/local_file.2",
-        ]
-        mock_compress_file_list.return_value = [
-            "/path/local_file.0.gz",
-            "/path/local_file.1.gz",
-            "/path/local_file.2.gz",
-        ]
-        r.load_and_copy(
-            "/path/local_file",
-            "s3_bucket",
-            "table_name",
-            delim="|",
-            copy_options=["IGNOREHEADER as 1"],
-            splits=3,
-            delete_s3_after=True,
-        )
+    assert load_copy_mocks.split_file.called
+    load_copy_mocks.compress_file_list.assert_called_with(["/path/local_file.txt"])
+    load_copy_mocks.s3_upload.assert_called_with(
+        "/path/local_file.txt.gz", "s3_bucket", "local_file.txt.gz"
+    )
+    load_copy_mocks.rs_copy.assert_called_with(
+        "table_name",
+        "s3://s3_bucket/local_file",
+        "|",
+        copy_options=["IGNOREHEADER as 1", "GZIP"],
+    )
+    assert not load_copy_mocks.s3_delete.called, "Only delete when explicit"
+
+
+def test_load_and_copy_split_only(load_copy_mocks, redshift):
+    load_copy_mocks.split_file.return_value = SPLIT_FILES
+    load_copy_mocks.compress_file_list.return_value = SPLIT_FILES_GZIP
+    redshift.load_and_copy(
+        "/path/local_file",
+        "s3_bucket",
+        "table_name",
+        delim="|",
+        splits=3,
+        delete_s3_after=True,
+    )
 
-        # assert
-        mock_split_file.assert_called_with(
-            "/path/local_file", "/path/local_file", splits=3, ignore_header=1
-        )
-        mock_compress_file_list.assert_called_with(
-            ["/path/local_file.0", "/path/local_file.1", "/path/local_file.2"]
-        )
-        # mock_remove.assert_called_with("/path/local_file.2")
-        mock_s3_upload.assert_has_calls(expected_calls_no_folder_gzip)
-        mock_rs_copy.assert_called_with(
-            "table_name", "s3://s3_bucket/local_file", "|", copy_options=["GZIP"]
-        )
-        assert mock_s3_delete.called_with("s3_bucket", "local_file.0.gz")
-        assert mock_s3_delete.called_with("s3_bucket", "local_file.1.gz")
-        assert mock_s3_delete.called_with("s3_bucket", "local_file.2.gz")
+    load_copy_mocks.split_file.assert_called_with(
+        "/path/local_file", "/path/local_file", splits=3, ignore_header=0
+    )
+    load_copy_mocks.compress_file_list.assert_called_with(SPLIT_FILES)
+    assert load_copy_mocks.s3_upload.call_args_list == EXPECTED_CALLS_NO_FOLDER_GZIP
+    load_copy_mocks.rs_copy.assert_called_with(
+        "table_name", "s3://s3_bucket/local_file", "|", copy_options=["GZIP"]
+    )
+    assert load_copy_mocks.s3_delete.call_args_list == EXPECTED_DELETES_NO_FOLDER_GZIP
+
+
+def test_load_and_copy_split_and_ignore_header(load_copy_mocks, redshift):
+    load_copy_mocks.split_file.return_value = SPLIT_FILES
+    load_copy_mocks.compress_file_list.return_value = SPLIT_FILES_GZIP
+    redshift.load_and_copy(
+        "/path/local_file",
+        "s3_bucket",
+        "table_name",
+        delim="|",
+        copy_options=["IGNOREHEADER as 1"],
+        splits=3,
+        delete_s3_after=True,
+    )
+
+    load_copy_mocks.split_file.assert_called_with(
+        "/path/local_file", "/path/local_file", splits=3, ignore_header=1
+    )
+    load_copy_mocks.compress_file_list.assert_called_with(SPLIT_FILES)
+    assert load_copy_mocks.s3_upload.call_args_list == EXPECTED_CALLS_NO_FOLDER_GZIP
+    load_copy_mocks.rs_copy.assert_called_with(
+        "table_name", "s3://s3_bucket/local_file", "|", copy_options=["GZIP"]
+    )
+    assert load_copy_mocks.s3_delete.call_args_list == EXPECTED_DELETES_NO_FOLDER_GZIP
+
+
+@pytest.mark.parametrize(
+    "copy_kwargs, delim_sql",
+    [
+        ({}, "DELIMITER '|' "),
+        ({"delim": "\t"}, "DELIMITER '\t' "),
+        ({"delim": None}, ""),
+    ],
+    ids=["default_delim", "tab_delim", "no_delim"],
+)
+@mock.patch("locopy.s3.Session")
+def test_redshiftcopy(
+    mock_session, copy_kwargs, delim_sql, mock_connect, credentials, dbapi
+):
+    mock_cursor = mock_connect.return_value.cursor.return_value
+    r = locopy.Redshift(dbapi=dbapi, **credentials)
+    r.connect()
+    r.session.get_credentials.return_value.configure_mock(
+        access_key="AK", secret_key="SK", token="TK"
+    )
+    r.copy("table", "s3bucket", **copy_kwargs)
+    mock_cursor.execute.assert_called_with(
+        "COPY table FROM 's3bucket' CREDENTIALS "
+        "'aws_access_key_id=AK;aws_secret_access_key=SK;token=TK' "
+        + delim_sql
+        + DEFAULT_COPY_OPTIONS_SQL
+        + ";",
+        (),
+    )
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 @mock.patch("locopy.s3.Session")
-def test_redshiftcopy(mock_session, credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        r = locopy.Redshift(dbapi=dbapi, **credentials)
-        r.connect()
+@mock.patch("locopy.database.Database._is_connected")
+def test_redshiftcopy_exception(
+    mock_connected, mock_session, mock_connect, credentials, dbapi
+):
+    mock_cursor = mock_connect.return_value.cursor.return_value
+    r = locopy.Redshift(dbapi=dbapi, **credentials)
+    mock_connected.return_value = False
+
+    with pytest.raises(DBError):
         r.copy("table", "s3bucket")
-        assert mock_connect.return_value.cursor.return_value.execute.called
-        (
-            mock_connect.return_value.cursor.return_value.execute.assert_called_with(
-                "COPY table FROM 's3bucket' CREDENTIALS "
-                f"'aws_access_key_id={r.session.get_credentials().access_key};aws_secret_access_key={r.session.get_credentials().secret_key};token={r.session.get_credentials().token}' "
-                "DELIMITER '|' DATEFORMAT 'auto' COMPUPDATE ON "
-                "TRUNCATECOLUMNS;",
-                (),
-            )
-        )
 
-        # tab delim
-        r.copy("table", "s3bucket", delim="\t")
-        assert mock_connect.return_value.cursor.return_value.execute.called
-        (
-            mock_connect.return_value.cursor.return_value.execute.assert_called_with(
-                "COPY table FROM 's3bucket' CREDENTIALS "
-                f"'aws_access_key_id={r.session.get_credentials().access_key};aws_secret_access_key={r.session.get_credentials().secret_key};token={r.session.get_credentials().token}' "
-                "DELIMITER '\t' DATEFORMAT 'auto' COMPUPDATE ON "
-                "TRUNCATECOLUMNS;",
-                (),
-            )
-        )
-        # no delim
-        r.copy("table", "s3bucket", delim=None)
-        assert mock_connect.return_value.cursor.return_value.execute.called
-        (
-            mock_connect.return_value.cursor.return_value.execute.assert_called_with(
-                "COPY table FROM 's3bucket' CREDENTIALS "
-                f"'aws_access_key_id={r.session.get_credentials().access_key};aws_secret_access_key={r.session.get_credentials().secret_key};token={r.session.get_credentials().token}' "
-                "DATEFORMAT 'auto' COMPUPDATE ON "
-                "TRUNCATECOLUMNS;",
-                (),
+    mock_connected.return_value = True
+    mock_cursor.execute.side_effect = Exception("COPY Exception")
+    with pytest.raises(DBError):
+        r.copy("table", "s3bucket")
+
+
+def test_unload_and_copy_basic(unload_copy_mocks, redshift):
+    # ensure nothing is returned when read=False
+    redshift.unload_and_copy(
+        query="query",
+        s3_bucket="s3_bucket",
+        s3_folder=None,
+        raw_unload_path=None,
+        export_path=False,
+        delim=",",
+        delete_s3_after=False,
+        parallel_off=False,
+    )
+
+    assert unload_copy_mocks.unload_generated_files.called
+    assert (
+        not unload_copy_mocks.write.called
+    ), "write_file should only be called if export_path != False"
+    unload_copy_mocks.generate_unload_path.assert_called_with("s3_bucket", None)
+    unload_copy_mocks.get_col_names.assert_called_with("query", cache=False)
+    unload_copy_mocks.unload.assert_called_with(
+        query="query", s3path="dummy_s3_path", unload_options=["DELIMITER ','"]
+    )
+    assert not unload_copy_mocks.delete_list_from_s3.called
+
+
+def test_unload_and_copy_delim_parallel_off(unload_copy_mocks, redshift):
+    redshift.unload_and_copy(
+        query="query",
+        s3_bucket="s3_bucket",
+        s3_folder=None,
+        raw_unload_path=None,
+        export_path=False,
+        delim="|",
+        delete_s3_after=False,
+        parallel_off=True,
+    )
+
+    # check that unload options are modified based on supplied args
+    unload_copy_mocks.unload.assert_called_with(
+        query="query",
+        s3path="dummy_s3_path",
+        unload_options=["DELIMITER '|'", "PARALLEL OFF"],
+    )
+    assert not unload_copy_mocks.delete_list_from_s3.called
+
+
+def test_unload_and_copy_no_delim(unload_copy_mocks, redshift):
+    redshift.unload_and_copy(
+        query="query",
+        s3_bucket="s3_bucket",
+        s3_folder=None,
+        raw_unload_path=None,
+        export_path=False,
+        delim=None,
+        delete_s3_after=False,
+        parallel_off=True,
+    )
+
+    # check that unload options are modified based on supplied args
+    unload_copy_mocks.unload.assert_called_with(
+        query="query", s3path="dummy_s3_path", unload_options=["PARALLEL OFF"]
+    )
+    assert not unload_copy_mocks.delete_list_from_s3.called
+
+
+def test_unload_and_copy_no_columns(unload_copy_mocks, redshift):
+    unload_copy_mocks.get_col_names.return_value = None
+    with pytest.raises(DBError):
+        redshift.unload_and_copy("query", "s3_bucket", None)
+
+
+def test_unload_and_copy_no_files(unload_copy_mocks, redshift):
+    unload_copy_mocks.unload_generated_files.return_value = None
+    with pytest.raises(DBError):
+        redshift.unload_and_copy("query", "s3_bucket", None)
+
+
+def test_unload_and_copy_export_path(unload_copy_mocks, redshift):
+    unload_copy_mocks.unload_generated_files.return_value = ["/dummy_file"]
+    redshift.unload_and_copy(
+        query="query",
+        s3_bucket="s3_bucket",
+        s3_folder=None,
+        raw_unload_path=None,
+        export_path="my_output.csv",
+        delim=",",
+        delete_s3_after=True,
+        parallel_off=False,
+    )
+
+    unload_copy_mocks.concat.assert_called_with(
+        unload_copy_mocks.download_list_from_s3.return_value, "my_output.csv"
+    )
+    assert unload_copy_mocks.write.called
+    unload_copy_mocks.delete_list_from_s3.assert_called_once_with(["/dummy_file"])
+
+
+def test_unload_and_copy_raw_unload_path(unload_copy_mocks, redshift):
+    unload_copy_mocks.unload_generated_files.return_value = ["/dummy_file"]
+    redshift.unload_and_copy(
+        query="query",
+        s3_bucket="s3_bucket",
+        s3_folder=None,
+        raw_unload_path="/somefolder/",
+        export_path=False,
+        delim=",",
+        delete_s3_after=False,
+        parallel_off=False,
+    )
+
+    unload_copy_mocks.download_list_from_s3.assert_called_with(
+        ["/dummy_file"], "/somefolder/"
+    )
+
+
+def test_unload_generated_files(connected_redshift):
+    cursor = connected_redshift.cursor
+    assert connected_redshift._unload_generated_files() is None
+
+    cursor.fetchall.return_value = [["File1 "], ["File2 "]]
+    assert connected_redshift._unload_generated_files() == ["File1", "File2"]
+
+    cursor.execute.side_effect = DBError()
+    with pytest.raises(DBError):
+        connected_redshift._unload_generated_files()
+
+
+def test_get_column_names(connected_redshift):
+    cursor = connected_redshift.cursor
+    assert connected_redshift._get_column_names("query") is None
+    cursor.execute.assert_called_with("SELECT * FROM (query) WHERE 1 = 0", ())
+
+    cursor.description = [["COL1 "], ["COL2 "]]
+    assert connected_redshift._get_column_names("query") == ["COL1", "COL2"]
+
+    # not cached unless asked for
+    cursor.execute.reset_mock()
+    connected_redshift._get_column_names("query")
+    assert cursor.execute.call_count == 1
+
+    cursor.execute.side_effect = DBError()
+    with pytest.raises(DBError):
+        connected_redshift._get_column_names("query")
+
+
+def test_get_column_names_cache(connected_redshift):
+    cursor = connected_redshift.cursor
+    cursor.description = [["COL1 "], ["COL2 "]]
+    assert connected_redshift._get_column_names("query", cache=True) == [
+        "COL1",
+        "COL2",
+    ]
+
+    # cached until the next connect
+    cursor.execute.reset_mock()
+    assert connected_redshift._get_column_names("query", cache=True) == [
+        "COL1",
+        "COL2",
+    ]
+    cursor.execute.assert_not_called()
+    connected_redshift._get_column_names("other query", cache=True)
+    assert cursor.execute.call_count == 1
+    connected_redshift.disconnect()
+    connected_redshift.connect()
+    connected_redshift._get_column_names("query", cache=True)
+    assert cursor.execute.call_count == 2
+
+    # reads keep the cache, anything which may change a table drops it
+    connected_redshift.execute("SELECT * FROM some_table")
+    connected_redshift._get_column_names("query", cache=True)
+    assert cursor.execute.call_count == 3
+    connected_redshift.execute("ALTER TABLE some_table ADD COLUMN col3 INT")
+    connected_redshift._get_column_names("query", cache=True)
+    assert cursor.execute.call_count == 5
+    cursor.execute.assert_called_with("SELECT * FROM (query) WHERE 1 = 0", ())
+    connected_redshift.execute("SELECT 1; DROP TABLE some_table")
+    connected_redshift._get_column_names("query", cache=True)
+    assert cursor.execute.call_count == 7
+
+    connected_redshift.execute("INSERT INTO some_table VALUES (';')")
+    connected_redshift._get_column_names("query", cache=True)
+    assert cursor.execute.call_count == 8
+
+    # DDL after leading comments
+    connected_redshift.execute("-- rebuild\nALTER TABLE some_table DROP COLUMN col3")
+    connected_redshift._get_column_names("query", cache=True)
+    assert cursor.execute.call_count == 10
+    connected_redshift.execute("/* x\n y */ DROP TABLE some_table")
+    connected_redshift._get_column_names("query", cache=True)
+    assert cursor.execute.call_count == 12
+
+    # SQL which is not a str cannot be checked, so it drops the cache
+    connected_redshift.execute(b"SELECT 1")
+    connected_redshift._get_column_names("query", cache=True)
+    assert cursor.execute.call_count == 14
+
+
+@pytest.mark.parametrize("cache, probes", [(False, 2), (True, 1)])
+def test_unload_and_copy_column_names(connected_redshift, aws_creds, cache, probes):
+    cursor = connected_redshift.cursor
+    cursor.fetchall.return_value = [["s3://bucket/prefix000 "]]
+    cursor.description = [["COL1 "]]
+    column_sql = "SELECT * FROM (SELECT 1) WHERE 1 = 0"
+    with mock.patch.multiple(
+        S3,
+        _generate_unload_path=mock.DEFAULT,
+        download_list_from_s3=mock.DEFAULT,
+        delete_list_from_s3=mock.DEFAULT,
+    ) as s3_methods, mock.patch.object(
+        connected_redshift.session, "get_credentials", return_value=aws_creds
+    ):
+        s3_methods["_generate_unload_path"].return_value = "s3://bucket/prefix"
+        for _ in range(2):
+            connected_redshift.unload_and_copy(
+                "SELECT 1", "bucket", cache_column_names=cache
             )
-        )
+
+    # the UNLOAD CREDENTIALS contain a ``;``, which must not drop the cache
+    unloads = [
+        c for c in cursor.execute.call_args_list if c.args[0].startswith("UNLOAD")
+    ]
+    assert len(unloads) == 2
+    assert "token=token" in unloads[0].args[0]
+    assert cursor.execute.call_args_list.count(mock.call(column_sql, ())) == probes
+
+
+def test_table_exists(connected_redshift):
+    cursor = connected_redshift.cursor
+    cursor.fetchone.return_value = (1,)
+    assert connected_redshift._table_exists("database.Schema.Test") is True
+    cursor.execute.assert_called_with(
+        "SELECT 1 FROM information_schema.tables WHERE table_name = %s AND table_schema = %s",
+        ("test", "schema"),
+    )
+
+    # unqualified names only match tables on the search path
+    cursor.fetchone.return_value = None
+    assert connected_redshift._table_exists("test") is False
+    cursor.execute.assert_called_with(
+        "SELECT 1 FROM information_schema.tables WHERE table_name = %s "
+        "AND table_schema = ANY(current_schemas(true))",
+        ("test",),
+    )
+
+    # quoted parts keep their case and lose the quotes
+    assert connected_redshift._table_exists('"MySchema"."T.""x"""') is False
+    cursor.execute.assert_called_with(
+        "SELECT 1 FROM information_schema.tables WHERE table_name = %s AND table_schema = %s",
+        ('T."x"', "MySchema"),
+    )
+    assert connected_redshift._table_exists('"Test"') is False
+    cursor.execute.assert_called_with(
+        "SELECT 1 FROM information_schema.tables WHERE table_name = %s "
+        "AND table_schema = ANY(current_schemas(true))",
+        ("Test",),
+    )
+
+    with pytest.raises(ValueError):
+        connected_redshift._table_exists('"MySchema.test')
+
+
+def testunload(connected_redshift):
+    connected_redshift.unload("query", "path")
+    assert connected_redshift.cursor.execute.called
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 @mock.patch("locopy.s3.Session")
-@mock.patch("locopy.database.Database._is_connected")
-def test_redshiftcopy_exception(mock_connected, mock_session, credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        r = locopy.Redshift(dbapi=dbapi, **credentials)
-        mock_connected.return_value = False
+def testunload_no_connection(mock_session, mock_connect, credentials, dbapi):
+    mock_cursor = mock_connect.return_value.cursor.return_value
+    r = locopy.Redshift(dbapi=dbapi, **credentials)
+    with pytest.raises(DBError):
+        r.unload("query", "path")
 
-        with pytest.raises(DBError):
-            r.copy("table", "s3bucket")
+    mock_cursor.execute.side_effect = DBError()
+    r = locopy.Redshift(dbapi=dbapi, **credentials)
+    r.connect()
+    with pytest.raises(DBError):
+        r.unload("query", "path")
 
-        mock_connected.return_value = True
-        (mock_connect.return_value.cursor.return_value.execute.side_effect) = Exception(
-            "COPY Exception"
-        )
-        with pytest.raises(DBError):
-            r.copy("table", "s3bucket")
-
-
-@pytest.mark.parametrize("dbapi", DBAPIS)
-@mock.patch("locopy.redshift.concatenate_files")
-@mock.patch("locopy.s3.S3.delete_list_from_s3")
-@mock.patch("locopy.redshift.write_file")
-@mock.patch("locopy.s3.S3.download_list_from_s3")
-@mock.patch("locopy.redshift.Redshift._get_column_names")
-@mock.patch("locopy.redshift.Redshift._unload_generated_files")
-@mock.patch("locopy.redshift.Redshift.unload")
-@mock.patch("locopy.s3.S3._generate_unload_path")
+
+@pytest.mark.parametrize("dbapi", ["pg8000"], indirect=True)
 @mock.patch("locopy.s3.Session")
-def test_unload_and_copy(
-    mock_session,
-    mock_generate_unload_path,
-    mock_unload,
-    mock_unload_generated_files,
-    mock_get_col_names,
-    mock_download_list_from_s3,
-    mock_write,
-    mock_delete_list_from_s3,
-    mock_concat,
-    credentials,
-    dbapi,
+def testinsert_dataframe_to_table_pandas(
+    mock_session, mock_connect, credentials, dbapi
 ):
-    def reset_mocks():
-        mock_session.reset_mock()
-        mock_generate_unload_path.reset_mock()
-        mock_unload_generated_files.reset_mock()
-        mock_get_col_names.reset_mock()
-        mock_write.reset_mock()
-        mock_download_list_from_s3.reset_mock()
-        mock_delete_list_from_s3.reset_mock()
-        mock_concat.reset_mock()
-
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        r = locopy.Redshift(dbapi=dbapi, **credentials)
-
-        ##
-        # Test 1: check that basic export pipeline functions are called
-        mock_unload_generated_files.return_value = ["dummy_file"]
-        mock_download_list_from_s3.return_value = ["s3.file"]
-        mock_get_col_names.return_value = ["dummy_col_name"]
-        mock_generate_unload_path.return_value = "dummy_s3_path"
-
-        # ensure nothing is returned when read=False
-        r.unload_and_copy(
-            query="query",
-            s3_bucket="s3_bucket",
-            s3_folder=None,
-            raw_unload_path=None,
-            export_path=False,
-            delim=",",
-            delete_s3_after=False,
-            parallel_off=False,
-        )
+    import pandas as pd
 
-        assert mock_unload_generated_files.called
-        assert not mock_write.called, (
-            "write_file should only be called " "if export_path != False"
-        )
-        mock_generate_unload_path.assert_called_with("s3_bucket", None)
-        mock_get_col_names.assert_called_with("query")
-        mock_unload.assert_called_with(
-            query="query", s3path="dummy_s3_path", unload_options=["DELIMITER ','"]
-        )
-        assert not mock_delete_list_from_s3.called
-
-        ##
-        # Test 2: different delimiter
-        reset_mocks()
-        mock_unload_generated_files.return_value = ["dummy_file"]
-        mock_download_list_from_s3.return_value = ["s3.file"]
-        mock_get_col_names.return_value = ["dummy_col_name"]
-        mock_generate_unload_path.return_value = "dummy_s3_path"
-        r.unload_and_copy(
-            query="query",
-            s3_bucket="s3_bucket",
-            s3_folder=None,
-            raw_unload_path=None,
-            export_path=False,
-            delim="|",
-            delete_s3_after=False,
-            parallel_off=True,
-        )
+    test_df = pd.read_csv(os.path.join(CURR_DIR, "data", "mock_dataframe.txt"), sep=",")
+    mock_cursor = mock_connect.return_value.cursor.return_value
+    r = locopy.Redshift(dbapi=dbapi, **credentials)
+    r.connect()
+    r.insert_dataframe_to_table(test_df, "database.schema.test")
+    mock_cursor.execute.assert_called_with(
+        "INSERT INTO database.schema.test (a,b,c) VALUES ('1', 'x', '2011-01-01'), ('2', 'y', '2001-04-02')",
+        (),
+    )
 
-        # check that unload options are modified based on supplied args
-        mock_unload.assert_called_with(
-            query="query",
-            s3path="dummy_s3_path",
-            unload_options=["DELIMITER '|'", "PARALLEL OFF"],
-        )
-        assert not mock_delete_list_from_s3.called
-
-        ##
-        # Test 2.5: delimiter is none
-        reset_mocks()
-        mock_unload_generated_files.return_value = ["dummy_file"]
-        mock_download_list_from_s3.return_value = ["s3.file"]
-        mock_get_col_names.return_value = ["dummy_col_name"]
-        mock_generate_unload_path.return_value = "dummy_s3_path"
-        r.unload_and_copy(
-            query="query",
-            s3_bucket="s3_bucket",
-            s3_folder=None,
-            raw_unload_path=None,
-            export_path=False,
-            delim=None,
-            delete_s3_after=False,
-            parallel_off=True,
-        )
+    r.insert_dataframe_to_table(test_df, "database.schema.test", create=True)
+    mock_cursor.execute.assert_any_call(
+        "CREATE TABLE database.schema.test (a int,b varchar,c date)", ()
+    )
+    mock_cursor.execute.assert_called_with(
+        "INSERT INTO database.schema.test (a,b,c) VALUES ('1', 'x', '2011-01-01'), ('2', 'y', '2001-04-02')",
+        (),
+    )
 
-        # check that unload options are modified based on supplied args
-        mock_unload.assert_called_with(
-            query="query", s3path="dummy_s3_path", unload_options=["PARALLEL OFF"]
-        )
-        assert not mock_delete_list_from_s3.called
-
-        ##
-        # Test 3: ensure exception is raised when no column names are retrieved
-        reset_mocks()
-        mock_unload_generated_files.return_value = ["dummy_file"]
-        mock_generate_unload_path.return_value = "dummy_s3_path"
-        mock_get_col_names.return_value = None
-        with pytest.raises(DBError):
-            r.unload_and_copy("query", "s3_bucket", None)
-
-        ##
-        # Test 4: ensure exception is raised when no files are returned
-        reset_mocks()
-        mock_generate_unload_path.return_value = "dummy_s3_path"
-        mock_get_col_names.return_value = ["dummy_col_name"]
-        mock_unload_generated_files.return_value = None
-        with pytest.raises(DBError):
-            r.unload_and_copy("query", "s3_bucket", None)
-
-        ##
-        # Test 5: ensure file writing is initiated when export_path is supplied
-        reset_mocks()
-        mock_get_col_names.return_value = ["dummy_col_name"]
-        mock_download_list_from_s3.return_value = ["s3.file"]
-        mock_generate_unload_path.return_value = "dummy_s3_path"
-        mock_unload_generated_files.return_value = ["/dummy_file"]
-        r.unload_and_copy(
-            query="query",
-            s3_bucket="s3_bucket",
-            s3_folder=None,
-            raw_unload_path=None,
-            export_path="my_output.csv",
-            delim=",",
-            delete_s3_after=True,
-            parallel_off=False,
-        )
-        mock_concat.assert_called_with(
-            mock_download_list_from_s3.return_value, "my_output.csv"
-        )
-        assert mock_write.called
-        assert mock_delete_list_from_s3.called_with("s3_bucket", "my_output.csv")
-
-        ##
-        # Test 6: raw_unload_path check
-        reset_mocks()
-        mock_get_col_names.return_value = ["dummy_col_name"]
-        mock_download_list_from_s3.return_value = ["s3.file"]
-        mock_generate_unload_path.return_value = "dummy_s3_path"
-        mock_unload_generated_files.return_value = ["/dummy_file"]
-        # ensure nothing is returned when read=False
-        r.unload_and_copy(
-            query="query",
-            s3_bucket="s3_bucket",
-            s3_folder=None,
-            raw_unload_path="/somefolder/",
-            export_path=False,
-            delim=",",
-            delete_s3_after=False,
-            parallel_off=False,
-        )
-        mock_download_list_from_s3.assert_called_with(["/dummy_file"], "/somefolder/")
+    r.insert_dataframe_to_table(test_df, "database.schema.test", columns=["a", "b"])
 
+    mock_cursor.execute.assert_called_with(
+        "INSERT INTO database.schema.test (a,b) VALUES ('1', 'x'), ('2', 'y')", ()
+    )
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
-@mock.patch("locopy.s3.Session")
-def test_unload_generated_files(mock_session, credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        r = locopy.Redshift(dbapi=dbapi, **credentials)
-        r.connect()
-        r._unload_generated_files()
-        assert r._unload_generated_files() is None
-
-        mock_connect.return_value.cursor.return_value.fetchall.return_value = [
-            ["File1 "],
-            ["File2 "],
-        ]
-        r = locopy.Redshift(dbapi=dbapi, **credentials)
-        r.connect()
-        r._unload_generated_files()
-        assert r._unload_generated_files() == ["File1", "File2"]
+    r.insert_dataframe_to_table(
+        test_df,
+        "database.schema.test",
+        create=True,
+        metadata=OrderedDict([("col1", "int"), ("col2", "varchar"), ("col3", "date")]),
+    )
 
-        mock_connect.return_value.cursor.return_value.execute.side_effect = DBError()
-        r = locopy.Redshift(dbapi=dbapi, **credentials)
-        r.connect()
-        with pytest.raises(DBError):
-            r._unload_generated_files()
+    mock_cursor.execute.assert_any_call(
+        "CREATE TABLE database.schema.test (col1 int,col2 varchar,col3 date)", ()
+    )
+    mock_cursor.execute.assert_called_with(
+        "INSERT INTO database.schema.test (col1,col2,col3) VALUES ('1', 'x', '2011-01-01'), ('2', 'y', '2001-04-02')",
+        (),
+    )
+
+    r.insert_dataframe_to_table(
+        test_df, "database.schema.test", create=False, batch_size=1
+    )
+
+    mock_cursor.execute.assert_any_call(
+        "INSERT INTO database.schema.test (a,b,c) VALUES ('1', 'x', '2011-01-01')",
+        (),
+    )
+    mock_cursor.execute.assert_any_call(
+        "INSERT INTO database.schema.test (a,b,c) VALUES ('2', 'y', '2001-04-02')",
+        (),
+    )
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
+@pytest.mark.parametrize("dbapi", ["pg8000"], indirect=True)
 @mock.patch("locopy.s3.Session")
-def test_get_column_names(mock_session, credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        r = locopy.Redshift(dbapi=dbapi, **credentials)
-        r.connect()
-        assert r._get_column_names("query") is None
-        sql = "SELECT * FROM (query) WHERE 1 = 0"
-        assert mock_connect.return_value.cursor.return_value.execute.called_with(
-            sql, ()
-        )
+def testinsert_dataframe_to_table_polars(
+    mock_session, mock_connect, credentials, dbapi
+):
+    import polars as pl
 
-        mock_connect.return_value.cursor.return_value.description = [
-            ["COL1 "],
-            ["COL2 "],
-        ]
-        r = locopy.Redshift(dbapi=dbapi, **credentials)
-        r.connect()
-        assert r._get_column_names("query") == ["COL1", "COL2"]
+    test_df = pl.read_csv(
+        os.path.join(CURR_DIR, "data", "mock_dataframe.txt"), separator=","
+    )
+    mock_cursor = mock_connect.return_value.cursor.return_value
+    r = locopy.Redshift(dbapi=dbapi, **credentials)
+    r.connect()
+    r.insert_dataframe_to_table(test_df, "database.schema.test")
+    mock_cursor.execute.assert_called_with(
+        "INSERT INTO database.schema.test (a,b,c) VALUES ('1', 'x', '2011-01-01'), ('2', 'y', '2001-04-02')",
+        (),
+    )
 
-        mock_connect.return_value.cursor.return_value.execute.side_effect = DBError()
-        r = locopy.Redshift(dbapi=dbapi, **credentials)
-        r.connect()
-        with pytest.raises(DBError):
-            r._get_column_names("query")
+    r.insert_dataframe_to_table(test_df, "database.schema.test", create=True)
+    mock_cursor.execute.assert_any_call(
+        "CREATE TABLE database.schema.test (a int,b varchar,c date)", ()
+    )
+    mock_cursor.execute.assert_called_with(
+        "INSERT INTO database.schema.test (a,b,c) VALUES ('1', 'x', '2011-01-01'), ('2', 'y', '2001-04-02')",
+        (),
+    )
 
+    r.insert_dataframe_to_table(test_df, "database.schema.test", columns=["a", "b"])
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
-@mock.patch("locopy.s3.Session")
-def testunload(mock_session, credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        r = locopy.Redshift(dbapi=dbapi, **credentials)
-        r.connect()
-        r.unload("query", "path")
-        assert mock_connect.return_value.cursor.return_value.execute.called
+    mock_cursor.execute.assert_called_with(
+        "INSERT INTO database.schema.test (a,b) VALUES ('1', 'x'), ('2', 'y')", ()
+    )
 
+    r.insert_dataframe_to_table(
+        test_df,
+        "database.schema.test",
+        create=True,
+        metadata=OrderedDict([("col1", "int"), ("col2", "varchar"), ("col3", "date")]),
+    )
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
-@mock.patch("locopy.s3.Session")
-def testunload_no_connection(mock_session, credentials, dbapi):
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        r = locopy.Redshift(dbapi=dbapi, **credentials)
-        with pytest.raises(DBError):
-            r.unload("query", "path")
-
-        mock_connect.return_value.cursor.return_value.execute.side_effect = DBError()
-        r = locopy.Redshift(dbapi=dbapi, **credentials)
-        r.connect()
-        with pytest.raises(DBError):
-            r.unload("query", "path")
+    mock_cursor.execute.assert_any_call(
+        "CREATE TABLE database.schema.test (col1 int,col2 varchar,col3 date)", ()
+    )
+    mock_cursor.execute.assert_called_with(
+        "INSERT INTO database.schema.test (col1,col2,col3) VALUES ('1', 'x', '2011-01-01'), ('2', 'y', '2001-04-02')",
+        (),
+    )
+
+    r.insert_dataframe_to_table(
+        test_df, "database.schema.test", create=False, batch_size=1
+    )
+
+    mock_cursor.execute.assert_any_call(
+        "INSERT INTO database.schema.test (a,b,c) VALUES ('1', 'x', '2011-01-01')",
+        (),
+    )
+    mock_cursor.execute.assert_any_call(
+        "INSERT INTO database.schema.test (a,b,c) VALUES ('2', 'y', '2001-04-02')",
+        (),
+    )
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
+@pytest.mark.parametrize("dbapi", ["psycopg2"], indirect=True)
+@pytest.mark.parametrize("df_type", ["pandas", "polars"])
+@mock.patch("psycopg2.extras.execute_values")
 @mock.patch("locopy.s3.Session")
-def testinsert_dataframe_to_table_pandas(mock_session, credentials, dbapi):
+def testinsert_dataframe_to_table_execute_values(
+    mock_session,
+    mock_execute_values,
+    df_type,
+    mock_connect,
+    credentials,
+    dbapi,
+    caplog,
+):
     import pandas as pd
+    import polars as pl
+
+    caplog.set_level("INFO")
 
     test_df = pd.read_csv(os.path.join(CURR_DIR, "data", "mock_dataframe.txt"), sep=",")
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        r = locopy.Redshift(dbapi=dbapi, **credentials)
-        r.connect()
+    test_df.loc[1, "b"] = None
+    if df_type == "polars":
+        test_df = pl.from_pandas(test_df)
+    mock_cursor = mock_connect.return_value.cursor.return_value
+    r = locopy.Redshift(dbapi=dbapi, **credentials)
+    r.connect()
+    r.insert_dataframe_to_table(test_df, "database.schema.test")
+    mock_execute_values.assert_called_once_with(
+        r.cursor,
+        "INSERT INTO database.schema.test (a,b,c) VALUES %s",
+        [("1", "x", "2011-01-01"), ("2", None, "2001-04-02")],
+        page_size=1000,
+    )
+    mock_cursor.execute.assert_not_called()
+    mock_connect.return_value.commit.assert_called_once_with()
+    # timed like any other statement run through execute
+    assert "Time elapsed" in caplog.text
+
+    mock_execute_values.reset_mock()
+    r.insert_dataframe_to_table(test_df, "database.schema.test", batch_size=1)
+    assert mock_execute_values.call_args_list == [
+        mock.call(
+            r.cursor,
+            "INSERT INTO database.schema.test (a,b,c) VALUES %s",
+            [("1", "x", "2011-01-01")],
+            page_size=1,
+        ),
+        mock.call(
+            r.cursor,
+            "INSERT INTO database.schema.test (a,b,c) VALUES %s",
+            [("2", None, "2001-04-02")],
+            page_size=1,
+        ),
+    ]
+
+    mock_execute_values.side_effect = Exception("SQL Exception")
+    with pytest.raises(DBError):
         r.insert_dataframe_to_table(test_df, "database.schema.test")
-        mock_connect.return_value.cursor.return_value.execute.assert_called_with(
-            "INSERT INTO database.schema.test (a,b,c) VALUES ('1', 'x', '2011-01-01'), ('2', 'y', '2001-04-02')",
-            (),
-        )
 
-        r.insert_dataframe_to_table(test_df, "database.schema.test", create=True)
-        mock_connect.return_value.cursor.return_value.execute.assert_any_call(
-            "CREATE TABLE database.schema.test (a int,b varchar,c date)", ()
-        )
-        mock_connect.return_value.cursor.return_value.execute.assert_called_with(
-            "INSERT INTO database.schema.test (a,b,c) VALUES ('1', 'x', '2011-01-01'), ('2', 'y', '2001-04-02')",
-            (),
-        )
 
-        r.insert_dataframe_to_table(test_df, "database.schema.test", columns=["a", "b"])
+@pytest.mark.parametrize("dbapi", ["pg8000"], indirect=True)
+@pytest.mark.parametrize("df_type", ["pandas", "polars"])
+@mock.patch("locopy.s3.Session")
+def testinsert_dataframe_to_table_null_and_quote(
+    mock_session, df_type, mock_connect, credentials, dbapi
+):
+    import pandas as pd
+    import polars as pl
 
-        mock_connect.return_value.cursor.return_value.execute.assert_called_with(
-            "INSERT INTO database.schema.test (a,b) VALUES ('1', 'x'), ('2', 'y')", ()
-        )
+    test_df = pd.DataFrame({"a": [1.5, None], "b": ["x'y", None], "c": [True, False]})
+    if df_type == "polars":
+        test_df = pl.from_pandas(test_df)
+    mock_cursor = mock_connect.return_value.cursor.return_value
+    r = locopy.Redshift(dbapi=dbapi, **credentials)
+    r.connect()
+    r.insert_dataframe_to_table(test_df, "database.schema.test")
+    mock_cursor.execute.assert_called_with(
+        "INSERT INTO database.schema.test (a,b,c) VALUES ('1.5', 'x''y', 'True'), (NULL, NULL, 'False')",
+        (),
+    )
 
-        r.insert_dataframe_to_table(
-            test_df,
-            "database.schema.test",
-            create=True,
-            metadata=OrderedDict(
-                [("col1", "int"), ("col2", "varchar"), ("col3", "date")]
-            ),
-        )
 
-        mock_connect.return_value.cursor.return_value.execute.assert_any_call(
-            "CREATE TABLE database.schema.test (col1 int,col2 varchar,col3 date)", ()
-        )
-        mock_connect.return_value.cursor.return_value.execute.assert_called_with(
-            "INSERT INTO database.schema.test (col1,col2,col3) VALUES ('1', 'x', '2011-01-01'), ('2', 'y', '2001-04-02')",
-            (),
-        )
+@pytest.mark.parametrize("dbapi", ["pg8000"], indirect=True)
+@pytest.mark.parametrize("df_type", ["pandas", "polars"])
+@mock.patch("locopy.s3.Session")
+def testinsert_dataframe_to_table_list_and_float32(
+    mock_session, df_type, mock_connect, credentials, dbapi
+):
+    import pandas as pd
+    import polars as pl
 
-        r.insert_dataframe_to_table(
-            test_df, "database.schema.test", create=False, batch_size=1
-        )
+    if df_type == "polars":
+        test_df = pl.DataFrame(
+            {
+                "a": [[1, 2], None],
+                "b": pl.Series([0.1, None], dtype=pl.Float32),
+            }
+        )
+    else:
+        test_df = pd.DataFrame(
+            {"a": [[1, 2], None], "b": pd.Series([0.1, None], dtype="float32")}
+        )
+    mock_cursor = mock_connect.return_value.cursor.return_value
+    r = locopy.Redshift(dbapi=dbapi, **credentials)
+    r.connect()
+    r.insert_dataframe_to_table(test_df, "database.schema.test")
+    mock_cursor.execute.assert_called_with(
+        "INSERT INTO database.schema.test (a,b) VALUES ('[1, 2]', '0.1'), (NULL, NULL)",
+        (),
+    )
 
-        mock_connect.return_value.cursor.return_value.execute.assert_any_call(
-            "INSERT INTO database.schema.test (a,b,c) VALUES ('1', 'x', '2011-01-01')",
-            (),
-        )
-        mock_connect.return_value.cursor.return_value.execute.assert_any_call(
-            "INSERT INTO database.schema.test (a,b,c) VALUES ('2', 'y', '2001-04-02')",
-            (),
-        )
+
+@pytest.mark.parametrize("dbapi", ["pg8000"], indirect=True)
+@mock.patch("locopy.s3.Session")
+def testinsert_dataframe_to_table_bytes(mock_session, mock_connect, credentials, dbapi):
+    import pandas as pd
+
+    # bytes are formatted with str(), as they were before the column-wise build
+    test_df = pd.DataFrame({"a": [b"ab", "x", None]})
+    mock_cursor = mock_connect.return_value.cursor.return_value
+    r = locopy.Redshift(dbapi=dbapi, **credentials)
+    r.connect()
+    r.insert_dataframe_to_table(test_df, "database.schema.test")
+    mock_cursor.execute.assert_called_with(
+        "INSERT INTO database.schema.test (a) VALUES ('b''ab'''), ('x'), (NULL)",
+        (),
+    )
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
+@pytest.mark.parametrize("dbapi", ["pg8000"], indirect=True)
 @mock.patch("locopy.s3.Session")
-def testinsert_dataframe_to_table_polars(mock_session, credentials, dbapi):
-    import polars as pl
+def testinsert_dataframe_to_table_if_exists(
+    mock_session, mock_connect, credentials, dbapi
+):
+    import pandas as pd
 
-    test_df = pl.read_csv(
-        os.path.join(CURR_DIR, "data", "mock_dataframe.txt"), separator=","
+    test_df = pd.read_csv(os.path.join(CURR_DIR, "data", "mock_dataframe.txt"), sep=",")
+    probe = (
+        "SELECT 1 FROM information_schema.tables WHERE table_name = %s AND table_schema = %s",
+        ("test", "schema"),
     )
-    with mock.patch(dbapi.__name__ + ".connect") as mock_connect:
-        r = locopy.Redshift(dbapi=dbapi, **credentials)
-        r.connect()
-        r.insert_dataframe_to_table(test_df, "database.schema.test")
-        mock_connect.return_value.cursor.return_value.execute.assert_called_with(
-            "INSERT INTO database.schema.test (a,b,c) VALUES ('1', 'x', '2011-01-01'), ('2', 'y', '2001-04-02')",
-            (),
-        )
+    create = ("CREATE TABLE database.schema.test (a int,b varchar,c date)", ())
+    drop = ("DROP TABLE database.schema.test", ())
+    insert = (
+        "INSERT INTO database.schema.test (a,b,c) VALUES ('1', 'x', '2011-01-01'), ('2', 'y', '2001-04-02')",
+        (),
+    )
+    mock_cursor = mock_connect.return_value.cursor.return_value
+    r = locopy.Redshift(dbapi=dbapi, **credentials)
+    r.connect()
+
+    # default: no probe, always create
+    r.insert_dataframe_to_table(test_df, "database.schema.test", create=True)
+    assert mock_cursor.execute.call_args_list == [
+        mock.call(*create),
+        mock.call(*insert),
+    ]
 
-        r.insert_dataframe_to_table(test_df, "database.schema.test", create=True)
-        mock_connect.return_value.cursor.return_value.execute.assert_any_call(
-            "CREATE TABLE database.schema.test (a int,b varchar,c date)", ()
-        )
-        mock_connect.return_value.cursor.return_value.execute.assert_called_with(
-            "INSERT INTO database.schema.test (a,b,c) VALUES ('1', 'x', '2011-01-01'), ('2', 'y', '2001-04-02')",
-            (),
-        )
+    mock_cursor.execute.reset_mock()
+    mock_cursor.fetchone.return_value = (1,)
+    r.insert_dataframe_to_table(
+        test_df, "database.schema.test", create=True, if_exists="append"
+    )
+    assert mock_cursor.execute.call_args_list == [
+        mock.call(*probe),
+        mock.call(*insert),
+    ]
 
-        r.insert_dataframe_to_table(test_df, "database.schema.test", columns=["a", "b"])
+    mock_cursor.execute.reset_mock()
+    r.insert_dataframe_to_table(
+        test_df, "database.schema.test", create=True, if_exists="replace"
+    )
+    assert mock_cursor.execute.call_args_list == [
+        mock.call(*probe),
+        mock.call(*drop),
+        mock.call(*create),
+        mock.call(*insert),
+    ]
 
-        mock_connect.return_value.cursor.return_value.execute.assert_called_with(
-            "INSERT INTO database.schema.test (a,b) VALUES ('1', 'x'), ('2', 'y')", ()
-        )
+    mock_cursor.execute.reset_mock()
+    mock_cursor.fetchone.return_value = None
+    r.insert_dataframe_to_table(
+        test_df, "database.schema.test", create=True, if_exists="append"
+    )
+    assert mock_cursor.execute.call_args_list == [
+        mock.call(*probe),
+        mock.call(*create),
+        mock.call(*insert),
+    ]
 
-        r.insert_dataframe_to_table(
-            test_df,
-            "database.schema.test",
-            create=True,
-            metadata=OrderedDict(
-                [("col1", "int"), ("col2", "varchar"), ("col3", "date")]
-            ),
-        )
+    with pytest.raises(ValueError):
+        r.insert_dataframe_to_table(test_df, "test", if_exists="skip")
 
-        mock_connect.return_value.cursor.return_value.execute.assert_any_call(
-            "CREATE TABLE database.schema.test (col1 int,col2 varchar,col3 date)", ()
-        )
-        mock_connect.return_value.cursor.return_value.execute.assert_called_with(
-            "INSERT INTO database.schema.test (col1,col2,col3) VALUES ('1', 'x', '2011-01-01'), ('2', 'y', '2001-04-02')",
-            (),
-        )
+    # a failed CREATE leaves the DROP uncommitted
+    def fail_create(sql, params):
+        if sql.startswith("CREATE"):
+            raise Exception("CREATE Exception")
 
+    mock_cursor.execute.reset_mock()
+    mock_cursor.execute.side_effect = fail_create
+    mock_cursor.fetchone.return_value = (1,)
+    mock_conn = mock_connect.return_value
+    mock_conn.commit.reset_mock()
+    with pytest.raises(DBError):
         r.insert_dataframe_to_table(
-            test_df, "database.schema.test", create=False, batch_size=1
-        )
-
-        mock_connect.return_value.cursor.return_value.execute.assert_any_call(
-            "INSERT INTO database.schema.test (a,b,c) VALUES ('1', 'x', '2011-01-01')",
-            (),
-        )
-        mock_connect.return_value.cursor.return_value.execute.assert_any_call(
-            "INSERT INTO database.schema.test (a,b,c) VALUES ('2', 'y', '2001-04-02')",
-            (),
+            test_df, "database.schema.test", create=True, if_exists="replace"
         )
+    assert mock_cursor.execute.call_args_list == [
+        mock.call(*probe),
+        mock.call(*drop),
+        mock.call(*create),
+    ]
+    # only the probe was committed
+    mock_conn.commit.assert_called_once_with()
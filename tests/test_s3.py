@@ -22,12 +22,12 @@
 
 import os
 import tempfile
+import threading
+import time
 from unittest import mock
 
 import hypothesis.strategies as st
 import locopy
-import pg8000
-import psycopg2
 import pytest
 from hypothesis import given
 from locopy.errors import (
@@ -45,46 +45,44 @@ S3_DEFAULT_BUCKET = "test bucket"
 LOCAL_TEST_FILE = "test file"
 CUSTOM_KEY = "custom key"
 KMS_KEY = "arn:aws:kms:us-east-1:9999999:key/0x0x0x0x0"
+AES_EXTRA = {"ServerSideEncryption": "AES256"}
+KMS_EXTRA = {"SSEKMSKeyId": KMS_KEY, "ServerSideEncryption": "aws:kms"}
+EXPECTED_CRED_NO_TOKEN = "aws_access_key_id=access;aws_secret_access_key=secret"
+EXPECTED_CRED_WITH_TOKEN = f"{EXPECTED_CRED_NO_TOKEN};token=token"
 GOOD_CONFIG_YAML = """host: host
 port: 1234
 dbname: db
 user: userid
 password: pass"""
 
-DBAPIS = [pg8000, psycopg2]
-
 CHAR_STRATEGY = st.characters()
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 @mock.patch("locopy.s3.Session")
 @given(profile=CHAR_STRATEGY)
-def test_mock_s3_session_profile_without_kms(profile, mock_session, dbapi):
+def test_mock_s3_session_profile_without_kms(profile, mock_session):
     s = locopy.S3(profile=profile)
     mock_session.assert_called_with(profile_name=profile)
     assert s.kms_key is None
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 @mock.patch("locopy.s3.Session")
 @given(input_kms_key=CHAR_STRATEGY, profile=CHAR_STRATEGY)
-def test_mock_s3_session_profile_with_kms(input_kms_key, profile, mock_session, dbapi):
+def test_mock_s3_session_profile_with_kms(input_kms_key, profile, mock_session):
     s = locopy.S3(profile=profile, kms_key=input_kms_key)
     mock_session.assert_called_with(profile_name=profile)
     assert s.kms_key == input_kms_key
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 @mock.patch("locopy.s3.Session")
-def test_mock_s3_session_profile_without_any(mock_session, dbapi):
+def test_mock_s3_session_profile_without_any(mock_session):
     s = locopy.S3()
     mock_session.assert_called_with(profile_name=None)
     assert s.kms_key is None
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 @mock.patch("locopy.s3.Session")
-def test_mock_s3_init_exception(mock_session, dbapi):
+def test_mock_s3_init_exception(mock_session):
     mock_session.side_effect = S3Error()
     with pytest.raises(S3Error):
         locopy.S3()
@@ -95,32 +93,35 @@ def test_mock_s3_init_exception(mock_session, dbapi):
         locopy.S3()
 
 
-@pytest.mark.parametrize("dbapi", DBAPIS)
 @mock.patch("locopy.s3.Config")
 @mock.patch("locopy.s3.Session")
-def test_mock_s3_set_client(mock_session, mock_config, dbapi):
-    s = locopy.S3(profile=PROFILE)
-    mock_config.assert_called_with(signature_version="s3v4")
+def test_mock_s3_set_client(mock_session, mock_config):
+    locopy.S3(profile=PROFILE)
+    mock_config.assert_called_with(signature_version="s3v4", max_pool_connections=80)
+
 
+@mock.patch("locopy.s3.Config")
+@mock.patch("locopy.s3.Session")
+def test_mock_s3_set_client_exception(mock_session, mock_config):
     mock_config.side_effect = Exception("_set_client Exception")
     with pytest.raises(S3InitializationError):
         locopy.S3(profile=PROFILE)
 
 
+@pytest.mark.parametrize(
+    "token, expected",
+    [("token", EXPECTED_CRED_WITH_TOKEN), (None, EXPECTED_CRED_NO_TOKEN)],
+)
 @mock.patch("locopy.s3.Session.get_credentials")
-def test_get_credentials(mock_cred, aws_creds):
-    s = locopy.S3()
+def test_get_credentials(mock_cred, aws_creds, token, expected):
+    aws_creds.token = token
     mock_cred.return_value = aws_creds
-    cred_string = s._credentials_string()
-    expected = "aws_access_key_id=access;" "aws_secret_access_key=secret;" "token=token"
-    assert cred_string == expected
+    s = locopy.S3()
+    assert s._credentials_string() == expected
 
-    aws_creds.token = None
-    mock_cred.return_value = aws_creds
-    cred_string = s._credentials_string()
-    expected = "aws_access_key_id=access;" "aws_secret_access_key=secret"
-    assert cred_string == expected
 
+@mock.patch("locopy.s3.Session.get_credentials")
+def test_get_credentials_exception(mock_cred):
     mock_cred.side_effect = S3CredentialsError("Exception")
     with pytest.raises(S3CredentialsError):
         locopy.S3()
@@ -146,62 +147,34 @@ def test_generate_unload_path(mock_session):
     assert s._generate_unload_path("TEST", None) == "s3://TEST"
 
 
+@pytest.mark.parametrize(
+    "kms_key, extra",
+    [(None, AES_EXTRA), (KMS_KEY, KMS_EXTRA)],
+)
+@pytest.mark.parametrize("key", [LOCAL_TEST_FILE, CUSTOM_KEY])
+@mock.patch("locopy.s3.TransferConfig")
 @mock.patch("locopy.s3.ProgressPercentage")
 @mock.patch("locopy.s3.Session")
-def test_upload_to_s3(mock_session, mock_progress):
-    mock_progress.return_value = None
-    s = locopy.S3()
-    s.upload_to_s3(LOCAL_TEST_FILE, S3_DEFAULT_BUCKET, LOCAL_TEST_FILE)
-    mock_progress.assert_called_with("test file")
-    s.s3.upload_file.assert_called_with(
-        LOCAL_TEST_FILE,
-        S3_DEFAULT_BUCKET,
-        os.path.basename(LOCAL_TEST_FILE),
-        ExtraArgs={"ServerSideEncryption": "AES256"},
-        Callback=None,
-    )
-
-    s = locopy.S3(kms_key=KMS_KEY)
-    s.upload_to_s3(LOCAL_TEST_FILE, S3_DEFAULT_BUCKET, LOCAL_TEST_FILE)
-    s.s3.upload_file.assert_called_with(
-        LOCAL_TEST_FILE,
-        S3_DEFAULT_BUCKET,
-        os.path.basename(LOCAL_TEST_FILE),
-        ExtraArgs={"SSEKMSKeyId": KMS_KEY, "ServerSideEncryption": "aws:kms"},
-        Callback=None,
-    )
-
-
-@mock.patch("locopy.s3.ProgressPercentage")
-@mock.patch("locopy.s3.Session")
-def test_upload_to_s3_with_custom_key(mock_session, mock_progress):
+def test_upload_to_s3(mock_session, mock_progress, mock_config, key, kms_key, extra):
     mock_progress.return_value = None
-    s = locopy.S3()
-    s.upload_to_s3(LOCAL_TEST_FILE, S3_DEFAULT_BUCKET, CUSTOM_KEY)
+    s = locopy.S3(kms_key=kms_key)
+    s.upload_to_s3(LOCAL_TEST_FILE, S3_DEFAULT_BUCKET, key)
     mock_progress.assert_called_with("test file")
+    mock_config.assert_called_with(max_concurrency=16)
     s.s3.upload_file.assert_called_with(
         LOCAL_TEST_FILE,
         S3_DEFAULT_BUCKET,
-        CUSTOM_KEY,
-        ExtraArgs={"ServerSideEncryption": "AES256"},
-        Callback=None,
-    )
-
-    s = locopy.S3(kms_key=KMS_KEY)
-    s.upload_to_s3(LOCAL_TEST_FILE, S3_DEFAULT_BUCKET, CUSTOM_KEY)
-    s.s3.upload_file.assert_called_with(
-        LOCAL_TEST_FILE,
-        S3_DEFAULT_BUCKET,
-        CUSTOM_KEY,
-        ExtraArgs={"SSEKMSKeyId": KMS_KEY, "ServerSideEncryption": "aws:kms"},
+        key,
+        ExtraArgs=extra,
         Callback=None,
+        Config=mock_config(),
     )
 
 
+@mock.patch("locopy.s3.TransferConfig")
 @mock.patch("locopy.s3.ProgressPercentage")
 @mock.patch("locopy.s3.Session")
-def test_upload_to_s3_exception(mock_session, mock_progress):
-    mock_progress.return_value = None
+def test_upload_to_s3_exception(mock_session, mock_progress, mock_config):
     s = locopy.S3()
     s.s3.upload_file.side_effect = Exception("Upload Exception")
     with pytest.raises(S3UploadError):
@@ -271,10 +244,15 @@ def test_download_from_s3(mock_session, mock_config):
     s.s3.download_file.assert_called_with(
         S3_DEFAULT_BUCKET,
         LOCAL_TEST_FILE,
-        os.path.basename(LOCAL_TEST_FILE),
+        LOCAL_TEST_FILE,
         Config=mock_config(),
     )
 
+
+@mock.patch("locopy.s3.TransferConfig")
+@mock.patch("locopy.s3.Session")
+def test_download_from_s3_exception(mock_session, mock_config):
+    s = locopy.S3()
     mock_config.side_effect = Exception()
     with pytest.raises(S3DownloadError):
         s.download_from_s3(S3_DEFAULT_BUCKET, LOCAL_TEST_FILE, LOCAL_TEST_FILE)
@@ -284,7 +262,11 @@ def test_download_from_s3(mock_session, mock_config):
 def test_delete_from_s3(mock_session):
     s = locopy.S3()
     s.delete_from_s3("TEST_BUCKET", "TEST_FILE")
-    s.s3.delete_object.assert_called_with(Bucket="TEST_BUCKET", Key="TEST_FILE")
+    s.delete_from_s3("B2", "F2")
+    assert s.s3.delete_object.call_args_list == [
+        mock.call(Bucket="TEST_BUCKET", Key="TEST_FILE"),
+        mock.call(Bucket="B2", Key="F2"),
+    ]
 
 
 @mock.patch("locopy.s3.Session")
@@ -441,6 +423,47 @@ def test_download_list_from_s3_multiple_with_localpath(mock_session, mock_downlo
     tmp_path.cleanup()
 
 
+@mock.patch("locopy.s3.S3.download_from_s3")
+@mock.patch("locopy.s3.Session")
+def test_download_list_from_s3_concurrent(mock_session, mock_download):
+    # both downloads must be in flight at once to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+    mock_download.side_effect = lambda *args: barrier.wait()
+    s = locopy.S3()
+    res = s.download_list_from_s3(["s3://bucket/test.1", "s3://bucket/test.2"])
+    assert res == [
+        os.path.join(os.getcwd(), "test.1"),
+        os.path.join(os.getcwd(), "test.2"),
+    ]
+    assert mock_download.call_count == 2
+
+
+@mock.patch("locopy.s3.S3.download_from_s3")
+@mock.patch("locopy.s3.Session")
+def test_download_list_from_s3_duplicate_names(mock_session, mock_download):
+    # files with the same name go to the same local path, so they must not
+    # be downloaded at the same time
+    running = threading.Semaphore(1)
+
+    def download(*args):
+        assert running.acquire(blocking=False), "concurrent download"
+        time.sleep(0.01)
+        running.release()
+
+    mock_download.side_effect = download
+    s = locopy.S3()
+    local = os.path.join(os.getcwd(), "test.1")
+    res = s.download_list_from_s3(
+        ["s3://bucket/a/test.1", "s3://bucket/b/test.1", "s3://bucket/c/test.1"]
+    )
+    assert res == [local, local, local]
+    assert mock_download.call_args_list == [
+        mock.call("bucket", "a/test.1", local),
+        mock.call("bucket", "b/test.1", local),
+        mock.call("bucket", "c/test.1", local),
+    ]
+
+
 @mock.patch("locopy.s3.S3.download_from_s3")
 @mock.patch("locopy.s3.Session")
 def test_download_list_from_s3_exception(mock_session, mock_download):
@@ -28,6 +28,7 @@ from unittest import mock
 
 import hypothesis.strategies as s
 import locopy
+import pandas as pd
 import polars as pl
 import pyarrow as pa
 import pytest
@@ -40,12 +41,13 @@ from polars.testing import assert_frame_equal
 PROFILE = "test"
 KMS = "kms_test"
 
-GOOD_CONFIG_YAML = """
-account: account
-warehouse: warehouse
-database: database
-user: user
-password: password"""
+GOOD_CONFIG = {
+    "account": "account",
+    "warehouse": "warehouse",
+    "database": "database",
+    "user": "user",
+    "password": "password",
+}
 
 DBAPIS = snowflake.connector
 
@@ -92,16 +94,17 @@ def test_constructor(input_kms_key, profile, mock_session, sf_credentials):
     assert sf.connection["password"] == "password"
 
 
-@mock.patch("locopy.utility.open", mock.mock_open(read_data=GOOD_CONFIG_YAML))
+@mock.patch("locopy.database.read_config_yaml", return_value=GOOD_CONFIG)
 @mock.patch("locopy.s3.Session")
 @given(input_kms_key=CHAR_STRATEGY, profile=CHAR_STRATEGY)
-def test_constructor_yaml(input_kms_key, profile, mock_session):
+def test_constructor_yaml(input_kms_key, profile, mock_session, mock_read_config_yaml):
     sf = Snowflake(
         profile=profile,
         kms_key=input_kms_key,
         dbapi=DBAPIS,
         config_yaml="some_config.yml",
     )
+    mock_read_config_yaml.assert_called_with("some_config.yml")
     mock_session.assert_called_with(profile_name=profile)
     assert sf.profile == profile
     assert sf.kms_key == input_kms_key
@@ -422,6 +425,29 @@ def test_to_pandas(mock_session, sf_credentials):
         sf.conn.cursor.return_value.fetchmany.assert_called_with(5)
 
 
+@mock.patch("locopy.s3.Session")
+def test_to_pandas_pyarrow(mock_session, sf_credentials):
+    with (
+        mock.patch("snowflake.connector.connect") as mock_connect,
+        Snowflake(profile=PROFILE, dbapi=DBAPIS, **sf_credentials) as sf,
+    ):
+        sf.cursor._query_result_format = "arrow"
+        sf.conn.cursor.return_value.fetch_arrow_all.return_value = pa.table(
+            {"a": [1, 2, 3], "b": ["x", "y", "z"]}
+        )
+        df = sf.to_dataframe(dtype_backend="pyarrow")
+        assert isinstance(df["b"].dtype, pd.ArrowDtype)
+        assert df["b"].tolist() == ["x", "y", "z"]
+        sf.conn.cursor.return_value.fetch_pandas_all.assert_not_called()
+
+        # no rows
+        sf.conn.cursor.return_value.fetch_arrow_all.return_value = None
+        assert sf.to_dataframe(dtype_backend="pyarrow") is None
+
+        with pytest.raises(ValueError):
+            sf.to_dataframe(dtype_backend="invalid")
+
+
 @mock.patch("locopy.s3.Session")
 def test_to_polars(mock_session, sf_credentials):
     with (
@@ -592,3 +618,54 @@ def test_insert_pl_dataframe_to_table(mock_session, sf_credentials):
             "INSERT INTO database.schema.test (a,b,c) VALUES (%s,%s,%s)",
             [("1", "x", "2011-01-01"), ("2", "y", "2001-04-02")],
         )
+
+
+@mock.patch("locopy.s3.Session")
+@mock.patch("snowflake.connector.pandas_tools.write_pandas")
+def test_insert_dataframe_to_table_write_pandas(
+    mock_write_pandas, mock_session, sf_credentials
+):
+    import pandas as pd
+
+    test_df = pd.read_csv(os.path.join(CURR_DIR, "data", "mock_dataframe.txt"), sep=",")
+    with (
+        mock.patch("snowflake.connector.connect") as mock_connect,
+        Snowflake(profile=PROFILE, dbapi=DBAPIS, **sf_credentials) as sf,
+    ):
+        sf.insert_dataframe_to_table(
+            test_df, "database.schema.test", use_write_pandas=True
+        )
+        args, kwargs = mock_write_pandas.call_args
+        assert args[0] is sf.conn
+        pd.testing.assert_frame_equal(args[1], test_df)
+        assert args[2] == "test"
+        assert kwargs == {
+            "database": "database",
+            "schema": "schema",
+            "quote_identifiers": False,
+        }
+        assert not sf.conn.cursor.return_value.executemany.called
+
+        sf.insert_dataframe_to_table(
+            pl.from_pandas(test_df),
+            "test",
+            create=True,
+            metadata=OrderedDict(
+                [("col1", "int"), ("col2", "varchar"), ("col3", "date")]
+            ),
+            use_write_pandas=True,
+        )
+        sf.conn.cursor.return_value.execute.assert_any_call(
+            "CREATE TABLE test (col1 int,col2 varchar,col3 date)", ()
+        )
+        args, kwargs = mock_write_pandas.call_args
+        assert list(args[1].columns) == ["col1", "col2", "col3"]
+        assert args[2] == "test"
+        assert kwargs["database"] is None
+        assert kwargs["schema"] is None
+
+        mock_write_pandas.side_effect = Exception("write_pandas Exception")
+        with pytest.raises(DBError):
+            sf.insert_dataframe_to_table(
+                test_df, "database.schema.test", use_write_pandas=True
+            )
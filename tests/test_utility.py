@@ -200,6 +200,15 @@ def test_split_file_header():
     cleanup(splits)
 
 
+@pytest.mark.parametrize("splits", [-1, 0, 5.65, "123", "Test"])
+def test_split_file_invalid_splits(splits):
+    input_file = "tests/data/mock_file.txt"
+    output_file = "tests/data/mock_output_file.txt"
+
+    with pytest.raises(LocopySplitError):
+        split_file(input_file, output_file, splits)
+
+
 def test_split_file_exception():
     input_file = "tests/data/mock_file.txt"
     output_file = "tests/data/mock_output_file.txt"
@@ -209,17 +218,6 @@ def test_split_file_exception():
     else:
         builtin_module_name = "__builtin__"
 
-    with pytest.raises(LocopySplitError):
-        split_file(input_file, output_file, -1)
-    with pytest.raises(LocopySplitError):
-        split_file(input_file, output_file, 0)
-    with pytest.raises(LocopySplitError):
-        split_file(input_file, output_file, 5.65)
-    with pytest.raises(LocopySplitError):
-        split_file(input_file, output_file, "123")
-    with pytest.raises(LocopySplitError):
-        split_file(input_file, output_file, "Test")
-
     with mock.patch(f"{builtin_module_name}.next") as mock_next:
         mock_next.side_effect = Exception("SomeException")
 